@@ -12,13 +12,37 @@ Tests:
 
 __version__ = "1.0.0"
 
-from .config import ConfigLoader, TestConfig, load_config
-from .client import BaseProviderClient, OpenAIClient, AnthropicClient, GoogleClient
-from .smoke import SmokeTestSuite, ProxySmokeTestSuite
-from .adaptor import AdaptorTestSuite
-from .differential import DifferentialTestSuite, DifferentialResult
-from .backend_validation import BackendValidationTestSuite, BackendValidationResult
-from .runner import TestRunner, main
+from importlib import import_module
+
+# Public names are resolved lazily (PEP 562) so that `python -m tests.runner`
+# only imports the suite modules it actually runs.
+_EXPORTS = {
+    "ConfigLoader": ".config",
+    "TestConfig": ".config",
+    "load_config": ".config",
+    "BaseProviderClient": ".client",
+    "OpenAIClient": ".client",
+    "AnthropicClient": ".client",
+    "GoogleClient": ".client",
+    "SmokeTestSuite": ".smoke",
+    "ProxySmokeTestSuite": ".smoke",
+    "AdaptorTestSuite": ".adaptor",
+    "DifferentialTestSuite": ".differential",
+    "DifferentialResult": ".differential",
+    "BackendValidationTestSuite": ".backend_validation",
+    "BackendValidationResult": ".backend_validation",
+    "TestRunner": ".runner",
+    "main": ".runner",
+}
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     "ConfigLoader",
@@ -108,9 +108,7 @@ class BackendValidationSuiteResult:
 
     @property
     def success_rate(self) -> float:
-        if self.total_tests == 0:
-            return 0.0
-        return (self.passed / self.total_tests) * 100
+        return 100.0 * self.passed / max(self.total_tests, 1)
 
 
 class BackendValidationTestSuite:
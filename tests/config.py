@@ -10,6 +10,11 @@ from typing import Optional
 from enum import Enum
 
 
+# Request model suffixes of the differential variant rules that the generated
+# test config adds next to each target rule
+DIFFERENTIAL_SUFFIXES = ("-xform", "-rt")
+
+
 class APIStyle(str, Enum):
     """API style enumeration."""
     OPENAI = "openai"
@@ -102,6 +107,9 @@ class TestConfig:
     timeout: int = 60
     verbose: bool = False
     output_dir: str = "./test_results"
+    # Caps on in-flight smoke requests, overall and per provider
+    global_concurrency: int = 16
+    per_provider_concurrency: int = 2
 
     @property
     def provider_names(self) -> list[str]:
@@ -136,6 +144,23 @@ class TestConfig:
                 return r
         return None
 
+    def get_target_rules(self) -> list[Rule]:
+        """Get the first active routed rule per request model, without differential variants.
+
+        These are the targets a run covers: one per scenario the test config was
+        generated for.
+        """
+        targets = {}
+        for r in self.rules:
+            if (
+                r.active
+                and r.request_model
+                and r.services
+                and not r.request_model.endswith(DIFFERENTIAL_SUFFIXES)
+            ):
+                targets.setdefault(r.request_model, r)
+        return list(targets.values())
+
     def get_service_model_for_rule(self, rule: Rule) -> Optional[str]:
         """Get the first service model for a rule."""
         for service in rule.services or []:
@@ -256,6 +281,8 @@ class ConfigLoader:
             timeout=data.get("timeout", 60),
             verbose=data.get("verbose", False),
             output_dir=data.get("output_dir", "./test_results"),
+            global_concurrency=data.get("global_concurrency", 16),
+            per_provider_concurrency=data.get("per_provider_concurrency", 2),
         )
 
     def _load_yaml(self, path: Path) -> TestConfig:
@@ -305,6 +332,8 @@ class ConfigLoader:
             timeout=data.get("timeout", 60),
             verbose=data.get("verbose", False),
             output_dir=data.get("output_dir", "./test_results"),
+            global_concurrency=data.get("global_concurrency", 16),
+            per_provider_concurrency=data.get("per_provider_concurrency", 2),
         )
 
 
@@ -57,9 +57,7 @@ class DifferentialTestSuiteResult:
 
     @property
     def success_rate(self) -> float:
-        if self.total_tests == 0:
-            return 0.0
-        return (self.passed / self.total_tests) * 100
+        return 100.0 * self.passed / max(self.total_tests, 1)
 
 
 class DifferentialTestSuite:
@@ -832,11 +830,7 @@ class DifferentialTestSuite:
 
         self._print("=== Running Differential Tests ===\n")
 
-        target_models = {"qwen-test", "glm-test", "minimax-test"}
-        base_rules = [
-            r for r in self.config.rules
-            if r.active and r.request_model in target_models and r.services
-        ]
+        base_rules = self.config.get_target_rules()
 
         if not base_rules:
             suite_result.duration_ms = (time.time() - start_time) * 1000
@@ -3,21 +3,593 @@
 Test runner for tingly-box provider tests.
 """
 
-import argparse
 import html
 import json
+import os
 import sys
 import time
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field, fields, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from types import SimpleNamespace
+from typing import Callable, Optional
 
+# Suite modules are imported inside the run_*_tests methods so a single-suite
+# run does not pay the import cost of the others.
 from .config import load_config, TestConfig
-from .smoke import SmokeTestSuite, ProxySmokeTestSuite
-from .adaptor import AdaptorTestSuite
-from .differential import DifferentialTestSuite
-from .backend_validation import BackendValidationTestSuite
+
+# Write buffer for streamed HTML reports
+_HTML_WRITE_BUFFER = 1 << 20
+
+# HTTP status colors keyed by status class (status_code // 100)
+_STATUS_COLORS = {2: "#10b981", 4: "#f59e0b", 5: "#ef4444"}
+_STATUS_COLOR_DEFAULT = "#6b7280"
+
+# Static report head (styles included); encoded once at import
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Tingly-Box Test Report</title>
+    <style>
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Oxygen, Ubuntu, sans-serif;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            padding: 20px;
+            line-height: 1.6;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 12px;
+            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
+            overflow: hidden;
+        }
+        .header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 30px;
+            text-align: center;
+        }
+        .header h1 {
+            font-size: 2.5em;
+            margin-bottom: 10px;
+        }
+        .header .subtitle {
+            font-size: 1.1em;
+            opacity: 0.9;
+        }
+        .summary {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 20px;
+            padding: 30px;
+            background: #f8f9fa;
+        }
+        .summary-card {
+            background: white;
+            padding: 20px;
+            border-radius: 8px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+            text-align: center;
+        }
+        .summary-card .label {
+            font-size: 0.9em;
+            color: #666;
+            margin-bottom: 10px;
+            text-transform: uppercase;
+            letter-spacing: 1px;
+        }
+        .summary-card .value {
+            font-size: 2.5em;
+            font-weight: bold;
+        }
+        .summary-card .value.passed { color: #10b981; }
+        .summary-card .value.failed { color: #ef4444; }
+        .summary-card .value.skipped { color: #f59e0b; }
+        .summary-card .value.rate { color: #667eea; }
+        .progress-bar {
+            padding: 30px;
+        }
+        .progress-track {
+            background: #e5e7eb;
+            height: 30px;
+            border-radius: 15px;
+            overflow: hidden;
+            display: flex;
+        }
+        .progress-segment {
+            height: 100%;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            color: white;
+            font-weight: bold;
+            font-size: 0.9em;
+            transition: width 0.3s ease;
+        }
+        .progress-passed { background: #10b981; }
+        .progress-failed { background: #ef4444; }
+        .progress-skipped { background: #f59e0b; }
+        .test-sections {
+            padding: 30px;
+        }
+        .section-title {
+            font-size: 1.5em;
+            margin-bottom: 20px;
+            color: #1f2937;
+            border-bottom: 2px solid #667eea;
+            padding-bottom: 10px;
+        }
+        .test-item {
+            background: #f9fafb;
+            border-left: 4px solid #d1d5db;
+            padding: 15px;
+            margin-bottom: 15px;
+            border-radius: 0 8px 8px 0;
+        }
+        .test-item.passed {
+            border-left-color: #10b981;
+            background: #f0fdf4;
+        }
+        .test-item.failed {
+            border-left-color: #ef4444;
+            background: #fef2f2;
+        }
+        .test-item.skipped {
+            border-left-color: #f59e0b;
+            background: #fffbeb;
+        }
+        .test-item-header {
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            margin-bottom: 10px;
+        }
+        .test-item-name {
+            font-weight: bold;
+            color: #1f2937;
+        }
+        .test-item-status {
+            padding: 4px 12px;
+            border-radius: 20px;
+            font-size: 0.85em;
+            font-weight: bold;
+            text-transform: uppercase;
+        }
+        .status-passed { background: #10b981; color: white; }
+        .status-failed { background: #ef4444; color: white; }
+        .status-skipped { background: #f59e0b; color: white; }
+        .test-item-message {
+            color: #6b7280;
+            font-size: 0.95em;
+            margin-bottom: 8px;
+        }
+        .test-item-details {
+            font-size: 0.85em;
+            color: #9ca3af;
+        }
+        .test-item-detail {
+            font-size: 0.85em;
+            color: #6b7280;
+            margin-top: 4px;
+        }
+        .error-box {
+            background: #fef2f2;
+            border: 1px solid #fecaca;
+            border-radius: 6px;
+            padding: 12px;
+            margin-top: 10px;
+            font-family: monospace;
+            font-size: 0.85em;
+            color: #991b1b;
+            overflow-x: auto;
+        }
+        .footer {
+            background: #1f2937;
+            color: white;
+            padding: 20px;
+            text-align: center;
+            font-size: 0.9em;
+        }
+        .footer a {
+            color: #667eea;
+            text-decoration: none;
+        }
+        .field-issues {
+            margin-top: 10px;
+        }
+        .field-issue {
+            background: #fffbeb;
+            border-left: 3px solid #f59e0b;
+            padding: 8px 12px;
+            margin-bottom: 6px;
+            border-radius: 0 4px 4px 0;
+            font-size: 0.85em;
+        }
+        .field-issue.error {
+            background: #fef2f2;
+            border-left-color: #ef4444;
+        }
+        .field-issue-path {
+            font-weight: bold;
+            color: #1f2937;
+        }
+        .field-issue-detail {
+            color: #6b7280;
+        }
+        .test-item-timestamp {
+            font-size: 0.8em;
+            color: #9ca3af;
+            margin-top: 4px;
+        }
+        .test-item-http {
+            font-size: 0.8em;
+            color: #6b7280;
+            margin-top: 4px;
+            padding: 8px;
+            background: #f3f4f6;
+            border-radius: 4px;
+            font-family: monospace;
+        }
+        .http-method {
+            color: #667eea;
+            font-weight: bold;
+        }
+        .http-url {
+            color: #059669;
+            word-break: break-all;
+        }
+        .http-status {
+            font-weight: bold;
+        }
+        .test-context {
+            margin-top: 10px;
+            padding: 10px;
+            background: #f9fafb;
+            border-left: 3px solid #d1d5db;
+            border-radius: 4px;
+            font-size: 0.85em;
+        }
+        .test-context strong {
+            color: #374151;
+        }
+        details.suite {
+            border: 1px solid #e5e7eb;
+            border-radius: 8px;
+            margin-bottom: 16px;
+            background: #fff;
+        }
+        .suite-summary {
+            cursor: pointer;
+            padding: 12px 16px;
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            font-weight: bold;
+            color: #1f2937;
+            list-style: none;
+        }
+        .suite-summary::-webkit-details-marker {
+            display: none;
+        }
+        .suite-summary::before {
+            content: "▸";
+            margin-right: 8px;
+            color: #6b7280;
+        }
+        details[open] > .suite-summary::before {
+            content: "▾";
+        }
+        .suite-summary.passed {
+            background: #f0fdf4;
+            border-bottom: 1px solid #e5e7eb;
+        }
+        .suite-summary.failed {
+            background: #fef2f2;
+            border-bottom: 1px solid #e5e7eb;
+        }
+        .suite-summary.skipped {
+            background: #fffbeb;
+            border-bottom: 1px solid #e5e7eb;
+        }
+        .suite-name {
+            font-size: 1.05em;
+        }
+        .suite-meta {
+            font-weight: normal;
+            color: #6b7280;
+            font-size: 0.9em;
+        }
+        .suite-body {
+            padding: 16px;
+        }
+        .suite-detail {
+            font-size: 0.9em;
+            color: #6b7280;
+            margin-bottom: 8px;
+        }
+        .config-block {
+            margin-top: 14px;
+            padding: 12px;
+            background: #0f172a;
+            color: #e2e8f0;
+            border-radius: 8px;
+            overflow-x: auto;
+            font-size: 12px;
+            line-height: 1.4;
+            white-space: pre;
+            text-align: left;
+            font-family: ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", monospace;
+        }
+        .config-details {
+            margin-top: 10px;
+            border: 1px solid #e5e7eb;
+            border-radius: 8px;
+            padding: 8px 12px;
+            background: #f8fafc;
+        }
+        .config-details summary {
+            cursor: pointer;
+            font-weight: 600;
+            color: #111827;
+        }
+        .json-key { color: #38bdf8; }
+        .json-string { color: #a7f3d0; }
+        .json-number { color: #fbbf24; }
+        .json-boolean { color: #f472b6; }
+        .json-null { color: #cbd5f5; }
+        .config-note {
+            color: #9ca3af;
+            font-size: 12px;
+            margin-top: 6px;
+        }
+    </style>
+</head>
+""".encode("utf-8")
+
+# Static report tail: renders the embedded config JSON with syntax highlighting
+_HTML_TAIL = """    <script>
+        (function () {
+            function escapeHtml(text) {
+                return text
+                    .replace(/&/g, '&amp;')
+                    .replace(/</g, '&lt;')
+                    .replace(/>/g, '&gt;');
+            }
+
+            function syntaxHighlight(jsonText) {
+                const escaped = escapeHtml(jsonText);
+                return escaped.replace(/(\"(\\\\u[a-zA-Z0-9]{4}|\\\\[^u]|[^\\\\\"])*\"\\s*:)|(\"(\\\\u[a-zA-Z0-9]{4}|\\\\[^u]|[^\\\\\"])*\")|\\b(true|false|null)\\b|-?\\d+(?:\\.\\d+)?(?:[eE][+\\-]?\\d+)?/g, (match) => {
+                    let cls = 'json-number';
+                    if (match.startsWith('\"')) {
+                        cls = match.endsWith(':') ? 'json-key' : 'json-string';
+                    } else if (match === 'true' || match === 'false') {
+                        cls = 'json-boolean';
+                    } else if (match === 'null') {
+                        cls = 'json-null';
+                    }
+                    return '<span class=\"' + cls + '\">' + match + '</span>';
+                });
+            }
+
+            const script = document.getElementById('config-json');
+            const target = document.getElementById('config-pre');
+            if (!script || !target) return;
+            try {
+                const data = JSON.parse(script.textContent || '{}');
+                const pretty = JSON.stringify(data, null, 2);
+                target.innerHTML = syntaxHighlight(pretty);
+            } catch (err) {
+                target.textContent = 'Failed to render config JSON';
+            }
+        })();
+    </script>
+</body>
+</html>""".encode("utf-8")
+
+# Result statuses and enum-like result fields repeat across every item, so
+# they are interned during normalization.
+_PASSED = sys.intern("passed")
+_FAILED = sys.intern("failed")
+_SKIPPED = sys.intern("skipped")
+_INTERNED_FIELDS = (
+    "test_type",
+    "verdict",
+    "api_style",
+    "client_style",
+    "provider_name",
+    "backend_provider",
+    "http_method",
+)
+
+
+def _format_timestamp(timestamp) -> str:
+    """Format an ISO-8601 timestamp as "YYYY-MM-DD HH:MM:SS", or "" if it is not one."""
+    if isinstance(timestamp, str) and len(timestamp) >= 19 and timestamp[10] == "T":
+        return timestamp[:19].replace("T", " ")
+    return ""
+
+
+def _normalize_result(d: dict) -> dict:
+    normalized = {
+        **d,
+        "_status": _PASSED if d.get("passed", False) else (_SKIPPED if d.get("verdict") == "inconclusive" or d.get("skipped") else _FAILED),
+        "_display_name": d.get("test_name") or d.get("test_type") or d.get("provider_name") or "Unknown",
+        "_timestamp_display": _format_timestamp(d.get("timestamp")),
+    }
+    for key in _INTERNED_FIELDS:
+        value = normalized.get(key)
+        if type(value) is str:
+            normalized[key] = sys.intern(value)
+    return normalized
+
+
+def _result_dict(result) -> dict:
+    """Return a result object's fields as a dict; slotted dataclasses have no __dict__."""
+    try:
+        return vars(result)
+    except TypeError:
+        return {f.name: getattr(result, f.name) for f in fields(result)}
+
+
+def _normalize_results(results: list) -> list[dict]:
+    """Convert suite result objects to plain dicts with precomputed display fields."""
+    return list(map(_normalize_result, map(_result_dict, results)))
+
+
+# Keys _normalize_result adds for rendering; they are not part of saved results
+_RENDER_KEYS = frozenset({"_status", "_display_name", "_timestamp_display"})
+
+
+def _saved_result(r):
+    """Return a results entry without its render-only keys, for serialization."""
+    if type(r) is dict:
+        return {k: v for k, v in r.items() if k not in _RENDER_KEYS}
+    if type(r) is tuple and len(r) == 2 and isinstance(r[1], TestRunResult):
+        # (suite name, suite result) entries of the aggregate run
+        name, suite = r
+        return name, replace(suite, results=list(map(_saved_result, suite.results)))
+    return r
+
+
+def _issue_value(issue_obj, key, default=""):
+    if isinstance(issue_obj, dict):
+        return issue_obj.get(key, default)
+    return getattr(issue_obj, key, default)
+
+
+def _render_test_item(r: dict) -> str:
+    """Render one normalized result dict as an HTML test item."""
+    backend = r.get("backend_provider")
+    style = r.get("client_style") or ""
+    provider_name = r.get("provider_name")
+    api_style = r.get("api_style")
+    source_style = r.get("source_style")
+    target_style = r.get("target_style")
+    http_method = r.get("http_method")
+    http_url = r.get("http_url")
+    http_status = r.get("http_status")
+    error = r.get("error")
+    field_issues = r.get("field_issues")
+    missing = r.get("missing_fields")
+    invalid = r.get("invalid_fields")
+
+    html = ""
+    status = r["_status"]
+
+    test_name_parts = []
+    if backend:
+        model = r.get("model", "")
+        test_name_parts.append(f"Testing {backend} backend")
+        test_name_parts.append(f"via {style.upper()} format")
+        if model:
+            test_name_parts.append(f"with model {model}")
+    else:
+        test_name_parts.append(r["_display_name"])
+
+    test_name = " ".join(test_name_parts)
+    message = r.get('message', '')
+    detail = r.get('detail', '')
+    provider_line = ""
+    if provider_name and api_style:
+        provider_line = f"Provider: {provider_name} | Style: {str(api_style).upper()}"
+    elif backend and style:
+        provider_line = f"Provider: {backend} | Style: {style.upper()}"
+    elif source_style and target_style:
+        provider_line = f"Style: {str(source_style).upper()} → {str(target_style).upper()}"
+    duration = r.get('duration_ms', 0)
+    timestamp = r["_timestamp_display"]
+
+    html += f"""
+    <div class="test-item {status}">
+        <div class="test-item-header">
+            <div class="test-item-name">{test_name}</div>
+            <div class="test-item-status status-{status}">{status.upper()}</div>
+        </div>
+        <div class="test-item-message">{message}</div>
+        <div class="test-item-details">Duration: {duration:.2f}ms"""
+
+    if timestamp:
+        html += f"""
+        <div class="test-item-timestamp">Timestamp: {timestamp}</div>"""
+
+    if http_method or http_url or http_status:
+        html += """
+        <div class="test-item-http">"""
+        if http_method:
+            html += f"<span class=\"http-method\">{http_method}</span> "
+        if http_url:
+            html += f"<span class=\"http-url\">{http_url}</span>"
+        if http_status:
+            status_color = _STATUS_COLORS.get(http_status // 100, _STATUS_COLOR_DEFAULT)
+            html += f" <span class=\"http-status\" style=\"color: {status_color}\">\"{http_status}\"</span>"
+        html += """
+        </div>"""
+
+    if provider_line:
+        html += f"""
+    <div class="test-item-detail">{provider_line}</div>"""
+    if detail:
+        html += f"""
+    <div class="test-item-detail">{detail}</div>"""
+
+    html += "</div>"
+
+    if error:
+        html += f"""
+        <div class="error-box">{error}</div>"""
+
+    if field_issues:
+        html += '<div class="field-issues">'
+        for issue in field_issues:
+            severity_class = 'error' if _issue_value(issue, 'severity') == 'error' else ''
+            field_path = _issue_value(issue, 'field_path')
+            issue_type = _issue_value(issue, 'issue_type')
+            expected = _issue_value(issue, 'expected')
+            actual = _issue_value(issue, 'actual')
+
+            html += f"""
+            <div class="field-issue {severity_class}">
+                <span class="field-issue-path">{field_path}</span>
+                <span class="field-issue-detail"> - {issue_type}: expected {expected}"""
+            if actual:
+                html += f", got {actual}"
+            html += "</div>"
+        html += '</div>'
+
+    if backend:
+        html += '<div class="test-context">'
+        html += f"<strong>Provider:</strong> {backend} | "
+        html += f"<strong>Style:</strong> {style.upper()}"
+        if missing:
+            html += f"<br><strong>Missing Fields:</strong> {', '.join(missing)}"
+        if invalid:
+            html += f"<br><strong>Invalid Fields:</strong> {', '.join(invalid.keys())}"
+        html += '</div>'
+
+    html += "</div>"
+    return html
+
+
+def _write_test_items(writer, items: list) -> None:
+    """Write rendered test items.
+
+    Rendered inline: save_html_report runs on a worker thread, so forking is
+    unsafe, and starting a spawned pool plus pickling the items costs more
+    than rendering them.
+    """
+    for r in items:
+        writer.write(_render_test_item(r).encode("utf-8"))
 
 
 @dataclass
@@ -48,7 +620,7 @@ class TestRunResult:
             "skipped": self.skipped,
             "duration_ms": self.duration_ms,
             "success_rate": self.success_rate,
-            "results": self.results,
+            "results": list(map(_saved_result, self.results)),
             "errors": self.errors,
         }
 
@@ -62,12 +634,18 @@ class TestRunner:
         verbose: bool = False,
         output_dir: str = "./test_results",
         server_url: Optional[str] = None,
+        loop_factory: Optional[Callable] = None,
     ):
         self.config_path = config_path
+        # Creates the smoke suites' event loop; None keeps SmokeRunner's default
+        self.loop_factory = loop_factory
         self.verbose = verbose
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.config = load_config(config_path)
+        # Encoders are reused across save_results/stream calls
+        self._json_encoder = json.JSONEncoder(indent=2, default=str)
+        self._jsonl_encoder = json.JSONEncoder(default=str)
 
         # Override server URL if provided
         if server_url:
@@ -77,6 +655,12 @@ class TestRunner:
         if self.verbose:
             print(msg)
 
+    def _use_loop_factory(self) -> None:
+        if self.loop_factory is not None:
+            from .smoke import SmokeRunner
+
+            SmokeRunner.loop_factory = self.loop_factory
+
     def _get_run_id(self) -> str:
         return datetime.now().strftime("%Y%m%d_%H%M%S")
 
@@ -95,22 +679,29 @@ class TestRunner:
 
     def run_smoke_tests(self) -> TestRunResult:
         """Run smoke tests for specified providers."""
+        from .smoke import SmokeTestSuite
+
+        self._use_loop_factory()
         self._print("\n=== Running Smoke Tests ===\n")
 
         suite = SmokeTestSuite(self.config, self.verbose)
 
-        # Filter to only test the true backends: qwen, glm, minimax
-        target_backends = {"glm", "qwen", "minimax"}
+        # Only test the backends the target rules route to
+        target_uuids = {
+            service.get("provider")
+            for rule in self.config.get_target_rules()
+            for service in rule.services
+        }
         filtered_providers = [
             p for p in self.config.providers
-            if p.name.lower() in target_backends
+            if p.uuid in target_uuids
         ]
 
         if filtered_providers:
             self._print(f"Testing {len(filtered_providers)} backends: {', '.join(p.name for p in filtered_providers)}")
             results = suite.run_all_tests(providers=filtered_providers)
         else:
-            self._print("Warning: No target backends (glm, deepseek, qwen) found in configuration")
+            self._print("Warning: No rule routes to a configured backend; testing all providers")
             results = suite.run_all_tests()
 
         return TestRunResult(
@@ -124,11 +715,14 @@ class TestRunner:
             skipped=results.skipped,
             duration_ms=results.duration_ms,
             success_rate=results.success_rate,
-            results=[r.__dict__ for r in results.results],
+            results=_normalize_results(results.results),
         )
 
     def run_proxy_smoke_tests(self) -> TestRunResult:
         """Run smoke tests for proxy endpoints."""
+        from .smoke import ProxySmokeTestSuite
+
+        self._use_loop_factory()
         self._print("\n=== Running Proxy Smoke Tests ===\n")
 
         suite = ProxySmokeTestSuite(self.config, self.verbose)
@@ -145,11 +739,13 @@ class TestRunner:
             skipped=results.skipped,
             duration_ms=results.duration_ms,
             success_rate=results.success_rate,
-            results=[r.__dict__ for r in results.results],
+            results=_normalize_results(results.results),
         )
 
     def run_adaptor_tests(self) -> TestRunResult:
         """Run adaptor transformation tests."""
+        from .adaptor import AdaptorTestSuite
+
         self._print("\n=== Running Adaptor Tests ===\n")
 
         suite = AdaptorTestSuite(self.config, self.verbose)
@@ -166,11 +762,13 @@ class TestRunner:
             skipped=0,
             duration_ms=results.duration_ms,
             success_rate=results.success_rate,
-            results=[r.__dict__ for r in results.results],
+            results=_normalize_results(results.results),
         )
 
     def run_differential_tests(self) -> TestRunResult:
         """Run differential transformation tests."""
+        from .differential import DifferentialTestSuite
+
         self._print("\n=== Running Differential Tests ===\n")
 
         suite = DifferentialTestSuite(self.config, self.verbose)
@@ -187,11 +785,13 @@ class TestRunner:
             skipped=results.inconclusive,
             duration_ms=results.duration_ms,
             success_rate=results.success_rate,
-            results=[r.__dict__ for r in results.results],
+            results=_normalize_results(results.results),
         )
 
     def run_backend_validation_tests(self) -> TestRunResult:
         """Run backend validation tests."""
+        from .backend_validation import BackendValidationTestSuite
+
         self._print("\n=== Running Backend Validation Tests ===\n")
 
         suite = BackendValidationTestSuite(self.config, self.verbose)
@@ -208,11 +808,16 @@ class TestRunner:
             skipped=0,
             duration_ms=results.duration_ms,
             success_rate=results.success_rate,
-            results=[r.__dict__ for r in results.results],
+            results=_normalize_results(results.results),
         )
 
-    def run_all_tests(self) -> TestRunResult:
-        """Run all test suites."""
+    def run_all_tests(self, stream: bool = False) -> TestRunResult:
+        """Run all test suites.
+
+        When ``stream`` is set, each suite result is appended to
+        ``test_results_<run_id>.jsonl`` as soon as the suite finishes, so
+        completed suites survive a crash in a later one.
+        """
         self._print("=" * 60)
         self._print("TINGLY-BOX TEST SYSTEM")
         self._print("=" * 60)
@@ -224,6 +829,7 @@ class TestRunner:
         total_skipped = 0
         total_duration = 0.0
 
+        run_id = self._get_run_id()
         start_time = time.time()
 
         test_suites = [
@@ -234,37 +840,48 @@ class TestRunner:
             ("Backend Validation Tests", self.run_backend_validation_tests),
         ]
 
-        for name, run_func in test_suites:
-            try:
-                result = run_func()
+        stream_file = (
+            open(self.output_dir / f"test_results_{run_id}.jsonl", "w", encoding="utf-8", buffering=1 << 20)
+            if stream
+            else nullcontext()
+        )
+        with stream_file as stream_out:
+            for name, run_func in test_suites:
+                try:
+                    result = run_func()
+                    total_tests += result.total_tests
+                    total_passed += result.passed
+                    total_failed += result.failed
+                    total_skipped += result.skipped
+                    total_duration += result.duration_ms
+                except Exception as e:
+                    self._print(f"{name} failed: {e}")
+                    result = TestRunResult(
+                        run_id=self._get_run_id(),
+                        timestamp=datetime.now().isoformat(),
+                        config_source=self.config_path or "default",
+                        suite_name=name,
+                        total_tests=0,
+                        passed=0,
+                        failed=0,
+                        skipped=0,
+                        duration_ms=0,
+                        success_rate=0,
+                        results=[],
+                        errors=[str(e)],
+                    )
                 all_results.append((name, result))
-                total_tests += result.total_tests
-                total_passed += result.passed
-                total_failed += result.failed
-                total_skipped += result.skipped
-                total_duration += result.duration_ms
-            except Exception as e:
-                self._print(f"{name} failed: {e}")
-                all_results.append((name, TestRunResult(
-                    run_id=self._get_run_id(),
-                    timestamp=datetime.now().isoformat(),
-                    config_source=self.config_path or "default",
-                    suite_name=name,
-                    total_tests=0,
-                    passed=0,
-                    failed=0,
-                    skipped=0,
-                    duration_ms=0,
-                    success_rate=0,
-                    results=[],
-                    errors=[str(e)],
-                )))
+
+                if stream_out is not None:
+                    stream_out.write(self._jsonl_encoder.encode(result.to_dict()))
+                    stream_out.write("\n")
+                    stream_out.flush()
 
         total_duration = (time.time() - start_time) * 1000
-        success_rate = (total_passed / total_tests * 100) if total_tests > 0 else 0
+        success_rate = 100.0 * total_passed / max(total_tests, 1)
 
         aggregate_result = TestRunResult(
-            run_id=self._get_run_id(),
+            run_id=run_id,
             timestamp=datetime.now().isoformat(),
             config_source=self.config_path or "default",
             suite_name="All Tests",
@@ -284,11 +901,11 @@ class TestRunner:
         if filename is None:
             filename = f"test_results_{result.run_id}.json"
 
-        filepath = self.output_dir / filename
+        filepath = os.fspath(self.output_dir / filename)
         with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(result.to_dict(), f, indent=2, default=str)
+            f.write(self._json_encoder.encode(result.to_dict()))
 
-        return str(filepath)
+        return filepath
 
     def save_html_report(self, result: TestRunResult, filename: Optional[str] = None) -> str:
         """Save test results as HTML report."""
@@ -301,133 +918,7 @@ class TestRunner:
         total = result.total_tests or 1
         passed_percent = (result.passed / total) * 100
         failed_percent = (result.failed / total) * 100
-        skipped_percent = (result.skipped / total) * 100
-
-        # Generate test results HTML
-        def _render_test_items(items: list) -> str:
-            html = ""
-            for r in items:
-                if not isinstance(r, dict):
-                    continue
-                status = "passed" if r.get("passed", False) else ("skipped" if r.get("verdict") == "inconclusive" else "failed")
-
-                test_name_parts = []
-                if r.get("backend_provider"):
-                    backend = r.get("backend_provider", "")
-                    style = r.get("client_style", "")
-                    model = r.get("model", "")
-                    test_name_parts.append(f"Testing {backend} backend")
-                    test_name_parts.append(f"via {style.upper()} format")
-                    if model:
-                        test_name_parts.append(f"with model {model}")
-                else:
-                    test_name_parts.append(r.get('test_name', r.get('test_type', r.get('provider_name', 'Unknown'))))
-
-                test_name = " ".join(test_name_parts)
-                message = r.get('message', '')
-                detail = r.get('detail', '')
-                provider_line = ""
-                if r.get("provider_name") and r.get("api_style"):
-                    provider_line = f"Provider: {r.get('provider_name')} | Style: {str(r.get('api_style')).upper()}"
-                elif r.get("backend_provider") and r.get("client_style"):
-                    provider_line = f"Provider: {r.get('backend_provider')} | Style: {str(r.get('client_style')).upper()}"
-                elif r.get("source_style") and r.get("target_style"):
-                    provider_line = f"Style: {str(r.get('source_style')).upper()} → {str(r.get('target_style')).upper()}"
-                duration = r.get('duration_ms', 0)
-                error = r.get('error', '')
-                timestamp = r.get('timestamp', '')
-
-                html += f"""
-                <div class="test-item {status}">
-                    <div class="test-item-header">
-                        <div class="test-item-name">{test_name}</div>
-                        <div class="test-item-status status-{status}">{status.upper()}</div>
-                    </div>
-                    <div class="test-item-message">{message}</div>
-                    <div class="test-item-details">Duration: {duration:.2f}ms"""
-
-                if timestamp:
-                    try:
-                        from datetime import datetime
-                        dt = datetime.fromisoformat(timestamp)
-                        formatted_time = dt.strftime("%Y-%m-%d %H:%M:%S")
-                        html += f"""
-                    <div class="test-item-timestamp">Timestamp: {formatted_time}</div>"""
-                    except:
-                        pass
-
-                if r.get("http_method") or r.get("http_url") or r.get("http_status"):
-                    html += """
-                    <div class="test-item-http">"""
-                    if r.get("http_method"):
-                        html += f"<span class=\"http-method\">{r['http_method']}</span> "
-                    if r.get("http_url"):
-                        html += f"<span class=\"http-url\">{r['http_url']}</span>"
-                    if r.get("http_status"):
-                        status_code = r['http_status']
-                        if 200 <= status_code < 300:
-                            status_color = "#10b981"
-                        elif 400 <= status_code < 500:
-                            status_color = "#f59e0b"
-                        elif 500 <= status_code < 600:
-                            status_color = "#ef4444"
-                        else:
-                            status_color = "#6b7280"
-                        html += f" <span class=\"http-status\" style=\"color: {status_color}\">\"{status_code}\"</span>"
-                    html += """
-                    </div>"""
-
-                if provider_line:
-                    html += f"""
-                <div class="test-item-detail">{provider_line}</div>"""
-                if detail:
-                    html += f"""
-                <div class="test-item-detail">{detail}</div>"""
-
-                html += "</div>"
-
-                if error:
-                    html += f"""
-                    <div class="error-box">{error}</div>"""
-
-                if r.get("field_issues"):
-                    def _issue_value(issue_obj, key, default=""):
-                        if isinstance(issue_obj, dict):
-                            return issue_obj.get(key, default)
-                        return getattr(issue_obj, key, default)
-                    html += '<div class="field-issues">'
-                    for issue in r.get("field_issues", []):
-                        severity_class = 'error' if _issue_value(issue, 'severity') == 'error' else ''
-                        field_path = _issue_value(issue, 'field_path')
-                        issue_type = _issue_value(issue, 'issue_type')
-                        expected = _issue_value(issue, 'expected')
-                        actual = _issue_value(issue, 'actual')
-
-                        html += f"""
-                        <div class="field-issue {severity_class}">
-                            <span class="field-issue-path">{field_path}</span>
-                            <span class="field-issue-detail"> - {issue_type}: expected {expected}"""
-                        if actual:
-                            html += f", got {actual}"
-                        html += "</div>"
-                    html += '</div>'
-
-                if r.get("backend_provider"):
-                    html += '<div class="test-context">'
-                    html += f"<strong>Provider:</strong> {r.get('backend_provider')} | "
-                    html += f"<strong>Style:</strong> {r.get('client_style', '').upper()}"
-                    if r.get("missing_fields"):
-                        html += f"<br><strong>Missing Fields:</strong> {', '.join(r.get('missing_fields', []))}"
-                    if r.get("invalid_fields"):
-                        invalid = r.get("invalid_fields", {})
-                        if invalid:
-                            html += f"<br><strong>Invalid Fields:</strong> {', '.join(invalid.keys())}"
-                    html += '</div>'
-
-                html += "</div>"
-            return html
-
-        test_results_html = ""
+        skipped_percent = (result.skipped / total) * 100
 
         suite_details = {
             "Smoke Tests": "Smoke: tingly-box scenario endpoints for list/models and chat.",
@@ -437,366 +928,13 @@ class TestRunner:
             "Backend Validation Tests": "Backend validation: field compliance of tingly-box responses.",
         }
 
-        if result.suite_name == "All Tests" and result.results:
-            for suite_name, suite_result in result.results:
-                suite_status = "passed"
-                if suite_result.failed > 0:
-                    suite_status = "failed"
-                elif suite_result.skipped > 0:
-                    suite_status = "skipped"
-
-                suite_items_html = _render_test_items(suite_result.results or [])
-                suite_detail = suite_details.get(suite_name, "")
-                suite_detail_html = f'<div class="suite-detail">{suite_detail}</div>' if suite_detail else ""
-                test_results_html += f"""
-                <details class="suite">
-                    <summary class="suite-summary {suite_status}">
-                        <span class="suite-name">{suite_name}</span>
-                        <span class="suite-meta">Passed: {suite_result.passed} | Failed: {suite_result.failed} | Skipped: {suite_result.skipped} | {suite_result.success_rate:.1f}%</span>
-                    </summary>
-                    <div class="suite-body">
-                        {suite_detail_html}
-                        <div class="test-item-details">Duration: {suite_result.duration_ms:.2f}ms</div>
-                        {suite_items_html}
-                    </div>
-                </details>"""
-        else:
-            test_results_html = _render_test_items(result.results)
-
         config_text, config_data, config_loaded = self._load_config_content(result.config_source)
         config_html = html.escape(config_text)
         config_note = "Config content unavailable." if not config_loaded else ""
         config_data_json = json.dumps(config_data or {"error": config_text}, ensure_ascii=True)
 
-        # Build HTML document
-        html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Tingly-Box Test Report</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Oxygen, Ubuntu, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            padding: 20px;
-            line-height: 1.6;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 12px;
-            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-            overflow: hidden;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            text-align: center;
-        }}
-        .header h1 {{
-            font-size: 2.5em;
-            margin-bottom: 10px;
-        }}
-        .header .subtitle {{
-            font-size: 1.1em;
-            opacity: 0.9;
-        }}
-        .summary {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            padding: 30px;
-            background: #f8f9fa;
-        }}
-        .summary-card {{
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            text-align: center;
-        }}
-        .summary-card .label {{
-            font-size: 0.9em;
-            color: #666;
-            margin-bottom: 10px;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-        }}
-        .summary-card .value {{
-            font-size: 2.5em;
-            font-weight: bold;
-        }}
-        .summary-card .value.passed {{ color: #10b981; }}
-        .summary-card .value.failed {{ color: #ef4444; }}
-        .summary-card .value.skipped {{ color: #f59e0b; }}
-        .summary-card .value.rate {{ color: #667eea; }}
-        .progress-bar {{
-            padding: 30px;
-        }}
-        .progress-track {{
-            background: #e5e7eb;
-            height: 30px;
-            border-radius: 15px;
-            overflow: hidden;
-            display: flex;
-        }}
-        .progress-segment {{
-            height: 100%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-weight: bold;
-            font-size: 0.9em;
-            transition: width 0.3s ease;
-        }}
-        .progress-passed {{ background: #10b981; }}
-        .progress-failed {{ background: #ef4444; }}
-        .progress-skipped {{ background: #f59e0b; }}
-        .test-sections {{
-            padding: 30px;
-        }}
-        .section-title {{
-            font-size: 1.5em;
-            margin-bottom: 20px;
-            color: #1f2937;
-            border-bottom: 2px solid #667eea;
-            padding-bottom: 10px;
-        }}
-        .test-item {{
-            background: #f9fafb;
-            border-left: 4px solid #d1d5db;
-            padding: 15px;
-            margin-bottom: 15px;
-            border-radius: 0 8px 8px 0;
-        }}
-        .test-item.passed {{
-            border-left-color: #10b981;
-            background: #f0fdf4;
-        }}
-        .test-item.failed {{
-            border-left-color: #ef4444;
-            background: #fef2f2;
-        }}
-        .test-item.skipped {{
-            border-left-color: #f59e0b;
-            background: #fffbeb;
-        }}
-        .test-item-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 10px;
-        }}
-        .test-item-name {{
-            font-weight: bold;
-            color: #1f2937;
-        }}
-        .test-item-status {{
-            padding: 4px 12px;
-            border-radius: 20px;
-            font-size: 0.85em;
-            font-weight: bold;
-            text-transform: uppercase;
-        }}
-        .status-passed {{ background: #10b981; color: white; }}
-        .status-failed {{ background: #ef4444; color: white; }}
-        .status-skipped {{ background: #f59e0b; color: white; }}
-        .test-item-message {{
-            color: #6b7280;
-            font-size: 0.95em;
-            margin-bottom: 8px;
-        }}
-        .test-item-details {{
-            font-size: 0.85em;
-            color: #9ca3af;
-        }}
-        .test-item-detail {{
-            font-size: 0.85em;
-            color: #6b7280;
-            margin-top: 4px;
-        }}
-        .error-box {{
-            background: #fef2f2;
-            border: 1px solid #fecaca;
-            border-radius: 6px;
-            padding: 12px;
-            margin-top: 10px;
-            font-family: monospace;
-            font-size: 0.85em;
-            color: #991b1b;
-            overflow-x: auto;
-        }}
-        .footer {{
-            background: #1f2937;
-            color: white;
-            padding: 20px;
-            text-align: center;
-            font-size: 0.9em;
-        }}
-        .footer a {{
-            color: #667eea;
-            text-decoration: none;
-        }}
-        .field-issues {{
-            margin-top: 10px;
-        }}
-        .field-issue {{
-            background: #fffbeb;
-            border-left: 3px solid #f59e0b;
-            padding: 8px 12px;
-            margin-bottom: 6px;
-            border-radius: 0 4px 4px 0;
-            font-size: 0.85em;
-        }}
-        .field-issue.error {{
-            background: #fef2f2;
-            border-left-color: #ef4444;
-        }}
-        .field-issue-path {{
-            font-weight: bold;
-            color: #1f2937;
-        }}
-        .field-issue-detail {{
-            color: #6b7280;
-        }}
-        .test-item-timestamp {{
-            font-size: 0.8em;
-            color: #9ca3af;
-            margin-top: 4px;
-        }}
-        .test-item-http {{
-            font-size: 0.8em;
-            color: #6b7280;
-            margin-top: 4px;
-            padding: 8px;
-            background: #f3f4f6;
-            border-radius: 4px;
-            font-family: monospace;
-        }}
-        .http-method {{
-            color: #667eea;
-            font-weight: bold;
-        }}
-        .http-url {{
-            color: #059669;
-            word-break: break-all;
-        }}
-        .http-status {{
-            font-weight: bold;
-        }}
-        .test-context {{
-            margin-top: 10px;
-            padding: 10px;
-            background: #f9fafb;
-            border-left: 3px solid #d1d5db;
-            border-radius: 4px;
-            font-size: 0.85em;
-        }}
-        .test-context strong {{
-            color: #374151;
-        }}
-        details.suite {{
-            border: 1px solid #e5e7eb;
-            border-radius: 8px;
-            margin-bottom: 16px;
-            background: #fff;
-        }}
-        .suite-summary {{
-            cursor: pointer;
-            padding: 12px 16px;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            font-weight: bold;
-            color: #1f2937;
-            list-style: none;
-        }}
-        .suite-summary::-webkit-details-marker {{
-            display: none;
-        }}
-        .suite-summary::before {{
-            content: "▸";
-            margin-right: 8px;
-            color: #6b7280;
-        }}
-        details[open] > .suite-summary::before {{
-            content: "▾";
-        }}
-        .suite-summary.passed {{
-            background: #f0fdf4;
-            border-bottom: 1px solid #e5e7eb;
-        }}
-        .suite-summary.failed {{
-            background: #fef2f2;
-            border-bottom: 1px solid #e5e7eb;
-        }}
-        .suite-summary.skipped {{
-            background: #fffbeb;
-            border-bottom: 1px solid #e5e7eb;
-        }}
-        .suite-name {{
-            font-size: 1.05em;
-        }}
-        .suite-meta {{
-            font-weight: normal;
-            color: #6b7280;
-            font-size: 0.9em;
-        }}
-        .suite-body {{
-            padding: 16px;
-        }}
-        .suite-detail {{
-            font-size: 0.9em;
-            color: #6b7280;
-            margin-bottom: 8px;
-        }}
-        .config-block {{
-            margin-top: 14px;
-            padding: 12px;
-            background: #0f172a;
-            color: #e2e8f0;
-            border-radius: 8px;
-            overflow-x: auto;
-            font-size: 12px;
-            line-height: 1.4;
-            white-space: pre;
-            text-align: left;
-            font-family: ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, "Liberation Mono", monospace;
-        }}
-        .config-details {{
-            margin-top: 10px;
-            border: 1px solid #e5e7eb;
-            border-radius: 8px;
-            padding: 8px 12px;
-            background: #f8fafc;
-        }}
-        .config-details summary {{
-            cursor: pointer;
-            font-weight: 600;
-            color: #111827;
-        }}
-        .json-key {{ color: #38bdf8; }}
-        .json-string {{ color: #a7f3d0; }}
-        .json-number {{ color: #fbbf24; }}
-        .json-boolean {{ color: #f472b6; }}
-        .json-null {{ color: #cbd5f5; }}
-        .config-note {{
-            color: #9ca3af;
-            font-size: 12px;
-            margin-top: 6px;
-        }}
-    </style>
-</head>
-<body>
+        # Header and summary; test items are streamed after it
+        html_body = f"""<body>
     <div class="container">
         <div class="header">
             <h1>🧪 Tingly-Box Test Report</h1>
@@ -841,8 +979,9 @@ class TestRunner:
         </div>
 
         <div class="test-sections">
-            <h2 class="section-title">Test Results</h2>
-            {test_results_html}
+            <h2 class="section-title">Test Results</h2>"""
+
+        html_footer = f"""
         </div>
 
         <div class="footer">
@@ -856,47 +995,42 @@ class TestRunner:
         </div>
     </div>
     <script id="config-json" type="application/json">{config_data_json}</script>
-    <script>
-        (function () {{
-            function escapeHtml(text) {{
-                return text
-                    .replace(/&/g, '&amp;')
-                    .replace(/</g, '&lt;')
-                    .replace(/>/g, '&gt;');
-            }}
-
-            function syntaxHighlight(jsonText) {{
-                const escaped = escapeHtml(jsonText);
-                return escaped.replace(/(\"(\\\\u[a-zA-Z0-9]{{4}}|\\\\[^u]|[^\\\\\"])*\"\\s*:)|(\"(\\\\u[a-zA-Z0-9]{{4}}|\\\\[^u]|[^\\\\\"])*\")|\\b(true|false|null)\\b|-?\\d+(?:\\.\\d+)?(?:[eE][+\\-]?\\d+)?/g, (match) => {{
-                    let cls = 'json-number';
-                    if (match.startsWith('\"')) {{
-                        cls = match.endsWith(':') ? 'json-key' : 'json-string';
-                    }} else if (match === 'true' || match === 'false') {{
-                        cls = 'json-boolean';
-                    }} else if (match === 'null') {{
-                        cls = 'json-null';
-                    }}
-                    return '<span class=\"' + cls + '\">' + match + '</span>';
-                }});
-            }}
+"""
 
-            const script = document.getElementById('config-json');
-            const target = document.getElementById('config-pre');
-            if (!script || !target) return;
-            try {{
-                const data = JSON.parse(script.textContent || '{{}}');
-                const pretty = JSON.stringify(data, null, 2);
-                target.innerHTML = syntaxHighlight(pretty);
-            }} catch (err) {{
-                target.textContent = 'Failed to render config JSON';
-            }}
-        }})();
-    </script>
-</body>
-</html>"""
+        # Stream the report so peak memory is bounded by the write buffer
+        # plus a single rendered item instead of the whole document.
+        with open(filepath, "wb", buffering=_HTML_WRITE_BUFFER) as writer:
+            writer.write(_HTML_HEAD)
+            writer.write(html_body.encode("utf-8"))
+
+            if result.suite_name == "All Tests" and result.results:
+                for suite_name, suite_result in result.results:
+                    suite_status = _PASSED
+                    if suite_result.failed > 0:
+                        suite_status = _FAILED
+                    elif suite_result.skipped > 0:
+                        suite_status = _SKIPPED
+
+                    suite_detail = suite_details.get(suite_name, "")
+                    suite_detail_html = f'<div class="suite-detail">{suite_detail}</div>' if suite_detail else ""
+                    writer.write(f"""
+                <details class="suite">
+                    <summary class="suite-summary {suite_status}">
+                        <span class="suite-name">{suite_name}</span>
+                        <span class="suite-meta">Passed: {suite_result.passed} | Failed: {suite_result.failed} | Skipped: {suite_result.skipped} | {suite_result.success_rate:.1f}%</span>
+                    </summary>
+                    <div class="suite-body">
+                        {suite_detail_html}
+                        <div class="test-item-details">Duration: {suite_result.duration_ms:.2f}ms</div>""".encode("utf-8"))
+                    _write_test_items(writer, suite_result.results or [])
+                    writer.write(b"""
+                    </div>
+                </details>""")
+            else:
+                _write_test_items(writer, result.results)
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(html_content)
+            writer.write(html_footer.encode("utf-8"))
+            writer.write(_HTML_TAIL)
 
         return str(filepath)
 
@@ -924,8 +1058,50 @@ class TestRunner:
                 print(f"  - {error}")
 
 
-def main():
-    """Main entry point for test runner."""
+# Boolean flags accepted by the fast CLI path, mapped to their argparse dest
+_FAST_FLAGS = {
+    "--all": "all", "-a": "all",
+    "--smoke": "smoke", "-s": "smoke",
+    "--proxy-smoke": "proxy_smoke", "-p": "proxy_smoke",
+    "--adaptor": "adaptor", "-d": "adaptor",
+    "--differential": "differential", "-f": "differential",
+    "--backend": "backend", "-b": "backend",
+    "--html": "html", "-H": "html",
+    "--verbose": "verbose", "-v": "verbose",
+    "--save": "save", "-S": "save",
+}
+
+
+def _parse_fast_args(argv: list[str]) -> Optional[SimpleNamespace]:
+    """Parse argv without argparse when it only contains boolean flags.
+
+    Returns None for anything else (value options, --help, unknown flags) so
+    the caller falls back to the full argparse parser.
+    """
+    if not all(arg in _FAST_FLAGS for arg in argv):
+        return None
+    args = SimpleNamespace(
+        config=None,
+        server_url=None,
+        output="./test_results",
+        loop="auto",
+        **{dest: False for dest in _FAST_FLAGS.values()},
+    )
+    for arg in argv:
+        setattr(args, _FAST_FLAGS[arg], True)
+    return args
+
+
+def _parse_args(argv: Optional[list[str]] = None):
+    """Parse CLI arguments (default: sys.argv[1:]), skipping argparse for plain flag combinations."""
+    if argv is None:
+        argv = sys.argv[1:]
+    args = _parse_fast_args(argv)
+    if args is not None:
+        return args
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Tingly-Box Provider Test System",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -937,6 +1113,7 @@ Examples:
   python -m tests.runner --differential --config tests/fixtures/interface.json
   python -m tests.runner --backend --config tests/fixtures/interface.json
   python -m tests.runner --all --html --save
+  python -m tests.runner --smoke --loop uvloop
         """,
     )
 
@@ -952,8 +1129,44 @@ Examples:
     parser.add_argument("--html", "-H", action="store_true", help="Generate HTML report")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose output")
     parser.add_argument("--save", "-S", action="store_true", help="Save results to JSON file")
+    parser.add_argument(
+        "--loop",
+        choices=("auto", "asyncio", "uvloop"),
+        default="auto",
+        help="Event loop for the smoke suites (auto: uvloop when installed)",
+    )
+
+    return parser.parse_args(argv)
 
-    args = parser.parse_args()
+
+def _event_loop_factory(name: str) -> Optional[Callable]:
+    """Return uvloop's loop factory unless the stdlib loop is requested or uvloop is missing.
+
+    Only the smoke suites' loop is affected; the process-wide event loop
+    policy is left alone.
+    """
+    if name == "asyncio":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        if name == "uvloop":
+            print("Warning: uvloop is not installed, using the default asyncio loop")
+        return None
+    return uvloop.new_event_loop
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Main entry point for test runner.
+
+    Args:
+        argv: CLI arguments without the program name; defaults to sys.argv[1:].
+
+    Returns:
+        Exit code: 1 if any test failed, else 0.
+    """
+    args = _parse_args(argv)
 
     if not any([args.all, args.smoke, args.proxy_smoke, args.adaptor, args.differential, args.backend]):
         args.all = True
@@ -963,10 +1176,11 @@ Examples:
         verbose=args.verbose,
         output_dir=args.output,
         server_url=args.server_url,
+        loop_factory=_event_loop_factory(args.loop),
     )
 
     if args.all:
-        result = runner.run_all_tests()
+        result = runner.run_all_tests(stream=args.save)
     elif args.smoke:
         result = runner.run_smoke_tests()
     elif args.proxy_smoke:
@@ -980,18 +1194,21 @@ Examples:
     else:
         result = runner.run_all_tests()
 
-    runner.print_summary(result)
+    # Write the reports in the background while the summary prints
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        json_save = pool.submit(runner.save_results, result) if args.save else None
+        html_save = pool.submit(runner.save_html_report, result) if args.html else None
+
+        runner.print_summary(result)
 
-    if args.save:
-        filepath = runner.save_results(result)
-        print(f"\nResults saved to: {filepath}")
+        if json_save:
+            print(f"\nResults saved to: {json_save.result()}")
 
-    if args.html:
-        filepath = runner.save_html_report(result)
-        print(f"HTML report saved to: {filepath}")
+        if html_save:
+            print(f"HTML report saved to: {html_save.result()}")
 
-    sys.exit(1 if result.failed > 0 else 0)
+    return 1 if result.failed > 0 else 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -2,10 +2,16 @@
 Smoke test suite for provider API testing.
 """
 
+import asyncio
+import atexit
 import time
+from array import array
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
-from typing import Optional
-from datetime import datetime
+from functools import partial
+from typing import Awaitable, Callable, Optional
+
+import httpx
 
 from .config import TestConfig, Provider, APIStyle, Rule
 from .client import (
@@ -13,14 +19,29 @@ from .client import (
     OpenAIClient,
     AnthropicClient,
     GoogleClient,
-    ProxyClient,
+    AsyncProxyClient,
+    create_async_http_client,
     ChatRequest,
     ChatMessage,
     TestResult,
 )
 
 
-@dataclass
+# (epoch second, its formatted "YYYY-MM-DDTHH:MM:SS") reused by _iso_now
+_iso_second: tuple[int, str] = (-1, "")
+
+
+def _iso_now() -> str:
+    """Local time in datetime.isoformat() form, reformatting the date part once per second."""
+    global _iso_second
+    t = time.time()
+    sec = int(t)
+    if sec != _iso_second[0]:
+        _iso_second = (sec, time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec)))
+    return f"{_iso_second[1]}.{int((t - sec) * 1e6):06d}"
+
+
+@dataclass(slots=True)
 class SmokeTestResult:
     """Result of a smoke test."""
     provider_name: str
@@ -29,15 +50,16 @@ class SmokeTestResult:
     passed: bool
     message: str
     duration_ms: float
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
-    details: dict = field(default_factory=dict)
+    timestamp: str = field(default_factory=_iso_now)
+    details: Optional[dict] = None
     http_method: Optional[str] = None
     http_url: Optional[str] = None
     http_status: Optional[int] = None
     error: Optional[str] = None
+    skipped: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SmokeTestSuiteResult:
     """Aggregate result of all smoke tests."""
     suite_name: str
@@ -47,40 +69,291 @@ class SmokeTestSuiteResult:
     skipped: int = 0
     results: list[SmokeTestResult] = field(default_factory=list)
     duration_ms: float = 0.0
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: str = field(default_factory=_iso_now)
+    # Parallel columns of the fields the summary aggregates over
+    _provider_names: list[str] = field(default_factory=list, repr=False, compare=False)
+    _passed_flags: array = field(default_factory=lambda: array("b"), repr=False, compare=False)
 
     @property
     def success_rate(self) -> float:
-        if self.total_tests == 0:
-            return 0.0
-        return (self.passed / self.total_tests) * 100
+        return 100.0 * self.passed / max(self.total_tests, 1)
+
+    def provider_stats(self) -> tuple[Counter, Counter]:
+        """Return (total, passed) test counts keyed by provider name."""
+        names = self._provider_names
+        totals = Counter(names)
+        passes = Counter(n for n, p in zip(names, self._passed_flags) if p)
+        return totals, passes
 
     def add_result(self, result: SmokeTestResult):
         self.results.append(result)
+        self._provider_names.append(result.provider_name)
+        self._passed_flags.append(result.passed)
         self.total_tests += 1
         if result.passed:
             self.passed += 1
+        elif result.skipped:
+            self.skipped += 1
         else:
             self.failed += 1
 
 
+class SmokeRunner:
+    """Event loop and pooled HTTP client shared by the smoke suites.
+
+    The synchronous ``run_all_tests`` entry points all run on this one loop, so
+    the AsyncClient (which is bound to the loop it first runs on) keeps its
+    keep-alive connections across suites. Both are closed at process exit.
+    Async entry points awaited on any other loop use a client of their own.
+    The loop is created by ``loop_factory`` (e.g. ``uvloop.new_event_loop``).
+    """
+
+    loop_factory: Callable[[], asyncio.AbstractEventLoop] = asyncio.new_event_loop
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _client: Optional[httpx.AsyncClient] = None
+
+    @classmethod
+    def run(cls, coro: Awaitable):
+        """Run a coroutine to completion on the shared loop."""
+        if cls._loop is None or cls._loop.is_closed():
+            cls._loop = cls.loop_factory()
+            atexit.register(cls.close)
+        return cls._loop.run_until_complete(coro)
+
+    @classmethod
+    def shared_client(cls, config: TestConfig) -> httpx.AsyncClient:
+        """Return the shared AsyncClient, creating it on first use."""
+        if cls._client is None or cls._client.is_closed:
+            cls._client = create_async_http_client(config.timeout)
+        return cls._client
+
+    @classmethod
+    def bind(cls, proxy_client: AsyncProxyClient, config: TestConfig) -> None:
+        """Point proxy_client at the shared client if running on the shared loop."""
+        if cls._loop is not None and asyncio.get_running_loop() is cls._loop:
+            proxy_client.use_client(cls.shared_client(config))
+        else:
+            proxy_client.use_client(None)
+
+    @classmethod
+    def close(cls) -> None:
+        loop, client = cls._loop, cls._client
+        cls._loop = cls._client = None
+        if loop is None or loop.is_closed():
+            return
+        if client is not None:
+            loop.run_until_complete(client.aclose())
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+def _to_smoke(result: TestResult, *, provider_name: str, api_style: str, test_type: str) -> SmokeTestResult:
+    """Build a SmokeTestResult from a client TestResult, including its HTTP info.
+
+    Takes ownership of ``result.data``: the HTTP fields are moved out of it and
+    the remainder, if any, is kept as ``details`` without copying.
+    """
+    data = result.data
+    if not data:
+        return SmokeTestResult(
+            provider_name=provider_name,
+            api_style=api_style,
+            test_type=test_type,
+            passed=result.success,
+            message=result.message,
+            duration_ms=result.duration_ms,
+            error=result.error,
+        )
+    return SmokeTestResult(
+        provider_name=provider_name,
+        api_style=api_style,
+        test_type=test_type,
+        passed=result.success,
+        message=result.message,
+        duration_ms=result.duration_ms,
+        http_method=data.pop("http_method", None),
+        http_url=data.pop("http_url", None),
+        http_status=data.pop("http_status", None),
+        details=data or None,
+        error=result.error,
+    )
+
+
+def _no_rule_result(provider: Provider, test_type: str) -> SmokeTestResult:
+    """Skip marker for a provider that no active rule routes to."""
+    return SmokeTestResult(
+        provider_name=provider.name,
+        api_style=provider.api_style.value,
+        test_type=test_type,
+        passed=False,
+        message="No routing rule found for provider",
+        duration_ms=0,
+        skipped=True,
+    )
+
+
+# A provider's remaining tests are skipped after this many consecutive results
+# that show it unreachable: no HTTP response at all, or a gateway error
+_CIRCUIT_BREAK_FAILURES = 2
+_UNREACHABLE_STATUSES = frozenset({None, 502, 503, 504})
+
+_DEFAULT_SYSTEM_PROMPT = "You are a helpful assistant."
+
+# Rule scenarios served through the Anthropic messages endpoint
+_ANTHROPIC_SCENARIOS = frozenset({"anthropic", "claude_code"})
+
+# Smoke test ops: the test_type each one reports and its progress label
+_TEST_TYPES = {
+    "list_models": "list_models",
+    "chat": "chat_completions",
+    "chat_sys": "chat_completions_with_system",
+}
+_OP_LABELS = {
+    "list_models": "list_models",
+    "chat": "chat_completions",
+    "chat_sys": "chat_with_system",
+}
+
+
+def _proxy_chat(
+    client: AsyncProxyClient, provider: Provider, rule: Rule, prompt: str, system: Optional[str] = None
+) -> Callable[[], Awaitable[TestResult]]:
+    """Bind the proxy chat request matching the provider's API style."""
+    if provider.api_style == APIStyle.ANTHROPIC:
+        extra = {"system": system, "messages": [{"role": "user", "content": prompt}]} if system else {}
+        return partial(
+            client.messages_anthropic,
+            model=rule.request_model,
+            prompt=prompt,
+            scenario=rule.scenario,
+            temperature=0.7,
+            max_tokens=100,
+            **extra,
+        )
+    extra = {"messages": [
+        {"role": "system", "content": system},
+        {"role": "user", "content": prompt},
+    ]} if system else {}
+    return partial(
+        client.chat_completions_openai,
+        model=rule.request_model,
+        prompt=prompt,
+        scenario=rule.scenario,
+        temperature=0.7,
+        max_tokens=100,
+        **extra,
+    )
+
+
+def _chat_request(model: str, prompt: str, system: Optional[str] = None) -> ChatRequest:
+    messages = [ChatMessage(role="user", content=prompt)]
+    if system:
+        messages.insert(0, ChatMessage(role="system", content=system))
+    return ChatRequest(model=model, messages=messages, temperature=0.7, max_tokens=100)
+
+
+# op -> binder returning a ready-to-call request, through the proxy (client, provider, rule, prompt, system)
+_PROXY_OPS: dict[str, Callable[..., Callable[[], Awaitable[TestResult]]]] = {
+    "list_models": lambda client, provider, rule, prompt, system: partial(
+        client.list_models_anthropic if provider.api_style == APIStyle.ANTHROPIC else client.list_models_openai,
+        scenario=rule.scenario,
+    ),
+    "chat": lambda client, provider, rule, prompt, system: _proxy_chat(client, provider, rule, prompt),
+    "chat_sys": lambda client, provider, rule, prompt, system: _proxy_chat(client, provider, rule, prompt, system),
+}
+
+# op -> binder returning a ready-to-call request, straight to the provider (client, model, prompt, system)
+_DIRECT_OPS: dict[str, Callable[..., Callable[[], Awaitable[TestResult]]]] = {
+    "list_models": lambda client, model, prompt, system: partial(asyncio.to_thread, client.list_models),
+    "chat": lambda client, model, prompt, system: partial(
+        asyncio.to_thread, client.chat_completions, _chat_request(model, prompt)
+    ),
+    "chat_sys": lambda client, model, prompt, system: partial(
+        asyncio.to_thread, client.chat_completions, _chat_request(model, prompt, system)
+    ),
+}
+
+
 class SmokeTestSuite:
     """Smoke test suite for provider API testing."""
 
     def __init__(self, config: TestConfig, verbose: bool = False):
         self.config = config
         self.verbose = verbose
-        self.proxy_client = ProxyClient(
+        self.proxy_client = AsyncProxyClient(
             server_url=config.server_url,
             token=config.auth_token,
             timeout=config.timeout,
         )
         self.proxy_only = True
+        if not verbose:
+            self._print = lambda msg: None
+        # First active rule routing to each provider UUID
+        self._rule_by_provider_uuid: dict[str, Rule] = {}
+        for rule in config.rules:
+            if not rule.active:
+                continue
+            for service in rule.services or []:
+                provider_uuid = service.get("provider")
+                if provider_uuid:
+                    self._rule_by_provider_uuid.setdefault(provider_uuid, rule)
+        # Proxy requests for run_all_tests bound once per routed provider UUID and op,
+        # so the API-style branch is not re-taken on every call
+        self._bound_tests: dict[str, dict[str, Callable[[], Awaitable[TestResult]]]] = {}
+        for provider in config.providers:
+            rule = self._rule_by_provider_uuid.get(provider.uuid)
+            if rule:
+                self._bound_tests[provider.uuid] = {
+                    op: bind(self.proxy_client, provider, rule, config.test_prompt, _DEFAULT_SYSTEM_PROMPT)
+                    for op, bind in _PROXY_OPS.items()
+                }
+        # Test model per provider UUID, filled by _get_test_model
+        self._model_cache: dict[str, Optional[str]] = {}
+        # Concurrency limits; (re)created per run since semaphores bind to the running loop
+        self._global_sem: Optional[asyncio.Semaphore] = None
+        self._provider_sems: dict[str, asyncio.Semaphore] = {}
+        self._sem_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Consecutive unreachable results per provider UUID, reset per run
+        self._failures: dict[str, int] = defaultdict(int)
 
     def _print(self, msg: str):
         if self.verbose:
             print(f"  [SMOKE] {msg}")
 
+    def _reset_limits(self) -> None:
+        """Create the semaphores for the running loop."""
+        self._global_sem = asyncio.Semaphore(self.config.global_concurrency)
+        self._provider_sems = {}
+        self._sem_loop = asyncio.get_running_loop()
+
+    async def _run_guarded(
+        self, provider: Provider, coro_factory: Callable[[], Awaitable[TestResult]]
+    ) -> Optional[TestResult]:
+        """Await a request while holding both the global and the per-provider slot.
+
+        Returns None without sending the request once the provider's circuit is
+        open, i.e. after _CIRCUIT_BREAK_FAILURES consecutive unreachable results.
+        """
+        if self._sem_loop is not asyncio.get_running_loop():
+            # Direct test_provider_* calls run outside run_all_tests_async
+            self._reset_limits()
+        provider_sem = self._provider_sems.setdefault(
+            provider.uuid, asyncio.Semaphore(self.config.per_provider_concurrency)
+        )
+        async with self._global_sem, provider_sem:
+            if self._failures[provider.uuid] >= _CIRCUIT_BREAK_FAILURES:
+                return None
+            try:
+                result = await coro_factory()
+            except Exception:
+                self._failures[provider.uuid] += 1
+                raise
+            if not result.success and (result.data or {}).get("http_status") in _UNREACHABLE_STATUSES:
+                self._failures[provider.uuid] += 1
+            else:
+                self._failures[provider.uuid] = 0
+            return result
+
     def _create_client(self, provider: Provider) -> BaseProviderClient:
         """Create appropriate client for provider."""
         if self.proxy_only:
@@ -113,261 +386,132 @@ class SmokeTestSuite:
             raise ValueError(f"Unknown API style: {provider.api_style}")
 
     def _get_rule_for_provider(self, provider: Provider) -> Optional[Rule]:
-        for rule in self.config.rules:
-            if not rule.active:
-                continue
-            for service in rule.services or []:
-                if service.get("provider") == provider.uuid:
-                    return rule
-        return None
-
-    def test_provider_model_fetch(self, provider: Provider) -> list[SmokeTestResult]:
-        """Test model fetching for a provider."""
-        results = []
-        self._print(f"Testing model fetch for {provider.name}")
-
-        try:
-            if self.proxy_only:
-                rule = self._get_rule_for_provider(provider)
-                if not rule:
-                    raise RuntimeError("No routing rule found for provider")
-                if provider.api_style == APIStyle.ANTHROPIC:
-                    result = self.proxy_client.list_models_anthropic(scenario=rule.scenario)
-                else:
-                    result = self.proxy_client.list_models_openai(scenario=rule.scenario)
-            else:
-                client = self._create_client(provider)
-                result = client.list_models()
-
-            smoke_result = SmokeTestResult(
-                provider_name=provider.name,
-                api_style=provider.api_style.value,
-                test_type="list_models",
-                passed=result.success,
-                message=result.message,
-                duration_ms=result.duration_ms,
-                details=result.data or {},
-                http_method=(result.data or {}).get("http_method"),
-                http_url=(result.data or {}).get("http_url"),
-                http_status=(result.data or {}).get("http_status"),
-                error=result.error,
-            )
-            results.append(smoke_result)
-
-            # Print detailed result
-            if self.verbose:
-                if result.success:
-                    self._print(f"  [SMOKE]   list_models: PASS - {result.message}")
-                    if result.data and 'models' in result.data:
-                        self._print(f"  [SMOKE]     Found {len(result.data['models'])} models")
-                else:
-                    self._print(f"  [SMOKE]   list_models: FAIL - {result.message}")
-                    if result.error:
-                        error_short = result.error[:100] + "..." if len(result.error) > 100 else result.error
-                        self._print(f"  [SMOKE]     Error: {error_short}")
-
-        except Exception as e:
-            results.append(SmokeTestResult(
-                provider_name=provider.name,
-                api_style=provider.api_style.value,
-                test_type="list_models",
-                passed=False,
-                message="Exception during test",
-                duration_ms=0,
-                error=str(e),
-            ))
-
-        return results
+        return self._rule_by_provider_uuid.get(provider.uuid)
 
-    def test_provider_chat(
+    async def _run_test(
         self,
         provider: Provider,
+        op: str,
         prompt: Optional[str] = None,
+        system: Optional[str] = None,
         model: Optional[str] = None,
+        call: Optional[Callable[[], Awaitable[TestResult]]] = None,
     ) -> list[SmokeTestResult]:
-        """Test chat completion for a provider."""
-        results = []
+        """Run one smoke test op ("list_models", "chat" or "chat_sys") for a provider.
 
+        ``call`` is a pre-bound proxy request (see ``_bound_tests``); when omitted the
+        request is bound here from ``prompt`` and ``system``.
+        """
+        SmokeRunner.bind(self.proxy_client, self.config)
+        test_type = _TEST_TYPES[op]
         test_prompt = prompt or self.config.test_prompt
-        test_model = model or self._get_test_model(provider)
-
-        if not test_model:
-            return [SmokeTestResult(
-                provider_name=provider.name,
-                api_style=provider.api_style.value,
-                test_type="chat_completions",
-                passed=False,
-                message="No test model available",
-                duration_ms=0,
-                error="No model specified or available",
-            )]
+        test_model = model
+        if op != "list_models":
+            test_model = model or self._get_test_model(provider)
+            if not test_model:
+                if op == "chat_sys":
+                    return []
+                return [SmokeTestResult(
+                    provider_name=provider.name,
+                    api_style=provider.api_style.value,
+                    test_type=test_type,
+                    passed=False,
+                    message="No test model available",
+                    duration_ms=0,
+                    error="No model specified or available",
+                )]
 
-        self._print(f"Testing chat for {provider.name} with model {test_model}")
+        if self.verbose:
+            self._print(f"Testing {test_type} for {provider.name}")
 
         try:
             if self.proxy_only:
                 rule = self._get_rule_for_provider(provider)
                 if not rule:
-                    raise RuntimeError("No routing rule found for provider")
-                if provider.api_style == APIStyle.ANTHROPIC:
-                    result = self.proxy_client.messages_anthropic(
-                        model=rule.request_model,
-                        prompt=test_prompt,
-                        scenario=rule.scenario,
-                        temperature=0.7,
-                        max_tokens=100,
-                    )
-                else:
-                    result = self.proxy_client.chat_completions_openai(
-                        model=rule.request_model,
-                        prompt=test_prompt,
-                        scenario=rule.scenario,
-                        temperature=0.7,
-                        max_tokens=100,
-                    )
+                    return [_no_rule_result(provider, test_type)]
+                if call is None:
+                    call = _PROXY_OPS[op](self.proxy_client, provider, rule, test_prompt, system)
             else:
                 client = self._create_client(provider)
-                request = ChatRequest(
-                    model=test_model,
-                    messages=[ChatMessage(role="user", content=test_prompt)],
-                    temperature=0.7,
-                    max_tokens=100,
-                )
-                result = client.chat_completions(request)
-
-            smoke_result = SmokeTestResult(
-                provider_name=provider.name,
-                api_style=provider.api_style.value,
-                test_type="chat_completions",
-                passed=result.success,
-                message=result.message,
-                duration_ms=result.duration_ms,
-                details=result.data or {},
-                http_method=(result.data or {}).get("http_method"),
-                http_url=(result.data or {}).get("http_url"),
-                http_status=(result.data or {}).get("http_status"),
-                error=result.error,
-            )
-            results.append(smoke_result)
-
-            # Print detailed result
-            if self.verbose:
-                if result.success:
-                    self._print(f"  [SMOKE]   chat_completions: PASS - {result.message}")
-                else:
-                    self._print(f"  [SMOKE]   chat_completions: FAIL - {result.message}")
-                    if result.error:
-                        error_short = result.error[:100] + "..." if len(result.error) > 100 else result.error
-                        self._print(f"  [SMOKE]     Error: {error_short}")
-
+                call = _DIRECT_OPS[op](client, test_model, test_prompt, system)
+            result = await self._run_guarded(provider, call)
         except Exception as e:
-            results.append(SmokeTestResult(
+            return [SmokeTestResult(
                 provider_name=provider.name,
                 api_style=provider.api_style.value,
-                test_type="chat_completions",
+                test_type=test_type,
                 passed=False,
                 message="Exception during test",
                 duration_ms=0,
                 error=str(e),
-            ))
+            )]
+        if result is None:
+            return [SmokeTestResult(
+                provider_name=provider.name,
+                api_style=provider.api_style.value,
+                test_type=test_type,
+                passed=False,
+                message="Circuit open",
+                duration_ms=0,
+                error=f"Skipped after {_CIRCUIT_BREAK_FAILURES} consecutive failures reaching the provider",
+            )]
 
-        return results
+        # Print detailed result
+        if self.verbose:
+            self._print(f"  {test_type}: {'PASS' if result.success else 'FAIL'} - {result.message}")
+            if result.success and result.data and "models" in result.data:
+                self._print(f"    Found {len(result.data['models'])} models")
+            if not result.success and result.error:
+                error_short = result.error[:100] + "..." if len(result.error) > 100 else result.error
+                self._print(f"    Error: {error_short}")
+
+        return [_to_smoke(
+            result,
+            provider_name=provider.name,
+            api_style=provider.api_style.value,
+            test_type=test_type,
+        )]
+
+    async def test_provider_model_fetch(self, provider: Provider) -> list[SmokeTestResult]:
+        """Test model fetching for a provider."""
+        return await self._run_test(provider, "list_models")
 
-    def test_provider_chat_with_system(
+    async def test_provider_chat(
         self,
         provider: Provider,
-        system_prompt: str = "You are a helpful assistant.",
+        prompt: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> list[SmokeTestResult]:
+        """Test chat completion for a provider."""
+        return await self._run_test(provider, "chat", prompt=prompt, model=model)
+
+    async def test_provider_chat_with_system(
+        self,
+        provider: Provider,
+        system_prompt: str = _DEFAULT_SYSTEM_PROMPT,
         user_prompt: Optional[str] = None,
         model: Optional[str] = None,
     ) -> list[SmokeTestResult]:
         """Test chat completion with system message."""
-        test_prompt = user_prompt or self.config.test_prompt
-        test_model = model or self._get_test_model(provider)
-
-        if not test_model:
-            return []
-
-        self._print(f"Testing chat with system for {provider.name}")
+        return await self._run_test(provider, "chat_sys", prompt=user_prompt, system=system_prompt, model=model)
 
+    @staticmethod
+    async def _indexed(index: int, coro: Awaitable[list[SmokeTestResult]]):
+        """Await a test coroutine, tagging its outcome (or exception) with its index."""
         try:
-            if self.proxy_only:
-                rule = self._get_rule_for_provider(provider)
-                if not rule:
-                    raise RuntimeError("No routing rule found for provider")
-                if provider.api_style == APIStyle.ANTHROPIC:
-                    result = self.proxy_client.messages_anthropic(
-                        model=rule.request_model,
-                        prompt=test_prompt,
-                        scenario=rule.scenario,
-                        system=system_prompt,
-                        messages=[{"role": "user", "content": test_prompt}],
-                        temperature=0.7,
-                        max_tokens=100,
-                    )
-                else:
-                    result = self.proxy_client.chat_completions_openai(
-                        model=rule.request_model,
-                        prompt=test_prompt,
-                        scenario=rule.scenario,
-                        messages=[
-                            {"role": "system", "content": system_prompt},
-                            {"role": "user", "content": test_prompt},
-                        ],
-                        temperature=0.7,
-                        max_tokens=100,
-                    )
-            else:
-                client = self._create_client(provider)
-                request = ChatRequest(
-                    model=test_model,
-                    messages=[
-                        ChatMessage(role="system", content=system_prompt),
-                        ChatMessage(role="user", content=test_prompt),
-                    ],
-                    temperature=0.7,
-                    max_tokens=100,
-                )
-                result = client.chat_completions(request)
-
-            smoke_result = SmokeTestResult(
-                provider_name=provider.name,
-                api_style=provider.api_style.value,
-                test_type="chat_completions_with_system",
-                passed=result.success,
-                message=result.message,
-                duration_ms=result.duration_ms,
-                details=result.data or {},
-                http_method=(result.data or {}).get("http_method"),
-                http_url=(result.data or {}).get("http_url"),
-                http_status=(result.data or {}).get("http_status"),
-                error=result.error,
-            )
-
-            # Print detailed result
-            if self.verbose:
-                if result.success:
-                    self._print(f"  [SMOKE]   chat_completions_with_system: PASS - {result.message}")
-                else:
-                    self._print(f"  [SMOKE]   chat_completions_with_system: FAIL - {result.message}")
-                    if result.error:
-                        error_short = result.error[:100] + "..." if len(result.error) > 100 else result.error
-                        self._print(f"  [SMOKE]     Error: {error_short}")
-
-            return [smoke_result]
-
+            return index, await coro
         except Exception as e:
-            return [SmokeTestResult(
-                provider_name=provider.name,
-                api_style=provider.api_style.value,
-                test_type="chat_completions_with_system",
-                passed=False,
-                message="Exception during test",
-                duration_ms=0,
-                error=str(e),
-            )]
+            return index, e
 
     def _get_test_model(self, provider: Provider) -> Optional[str]:
         """Get test model for provider."""
+        if provider.uuid in self._model_cache:
+            return self._model_cache[provider.uuid]
+        model = self._resolve_test_model(provider)
+        self._model_cache[provider.uuid] = model
+        return model
+
+    def _resolve_test_model(self, provider: Provider) -> Optional[str]:
         if self.config.test_model:
             return self.config.test_model
 
@@ -375,15 +519,16 @@ class SmokeTestSuite:
             return provider.models[0]
 
         # Use specific model names based on provider and API style
+        name = provider.name.lower()
         if provider.api_style == APIStyle.OPENAI:
-            if provider.name.lower() == "qwen":
+            if name == "qwen":
                 return "qwen-plus"
-            elif provider.name.lower() == "deepseek":
+            elif name == "deepseek":
                 return "deepseek-chat"
             else:
                 return "tingly-gpt"
         elif provider.api_style == APIStyle.ANTHROPIC:
-            if provider.name.lower() == "glm":
+            if name == "glm":
                 return "glm-4.7"
             else:
                 return "tingly-claude"
@@ -392,6 +537,10 @@ class SmokeTestSuite:
 
     def run_all_tests(self, providers: Optional[list[Provider]] = None) -> SmokeTestSuiteResult:
         """Run all smoke tests for providers."""
+        return SmokeRunner.run(self.run_all_tests_async(providers))
+
+    async def run_all_tests_async(self, providers: Optional[list[Provider]] = None) -> SmokeTestSuiteResult:
+        """Run all smoke tests for providers concurrently."""
         suite_result = SmokeTestSuiteResult(suite_name="Smoke Test Suite")
         test_providers = providers or self.config.providers
 
@@ -399,30 +548,66 @@ class SmokeTestSuite:
             self._print("No providers to test")
             return suite_result
 
-        start_time = time.time()
-
+        start_ns = time.perf_counter_ns()
+        unrouted = []
+        if self.proxy_only:
+            # Providers no rule routes to cannot be reached through the proxy
+            routed = [p for p in test_providers if p.uuid in self._rule_by_provider_uuid]
+            if len(routed) != len(test_providers):
+                unrouted = [p for p in test_providers if p.uuid not in self._rule_by_provider_uuid]
+                test_providers = routed
+        self._reset_limits()
+        self._failures = defaultdict(int)
+        SmokeRunner.bind(self.proxy_client, self.config)
+
+        # Every (provider, test) pair is independent and I/O-bound, so they
+        # all run at once. Progress is printed as each test finishes, while the
+        # suite result keeps submission order so reports stay stable.
+        # Requests are deliberately not coalesced into one server-side batch
+        # call: each must hit the real /tingly/<scenario> endpoint a client
+        # would use. The shared pooled client already amortizes connection cost.
+        labels = []
+        tasks = []
         for provider in test_providers:
-            self._print(f"\n--- Testing {provider.name} ({provider.api_style.value}) ---")
-
-            results = self.test_provider_model_fetch(provider)
-            for r in results:
-                suite_result.add_result(r)
-                if self.verbose:
-                    self._print(f"  list_models: {'PASS' if r.passed else 'FAIL'} - {r.message}")
-
-            results = self.test_provider_chat(provider)
-            for r in results:
-                suite_result.add_result(r)
+            bound = self._bound_tests.get(provider.uuid, {})
+            for op, label in _OP_LABELS.items():
+                labels.append((provider, label, _TEST_TYPES[op]))
+                tasks.append(self._indexed(len(tasks), self._run_test(
+                    provider, op, system=_DEFAULT_SYSTEM_PROMPT if op == "chat_sys" else None, call=bound.get(op)
+                )))
+
+        outcomes: list[list[SmokeTestResult]] = [[] for _ in tasks]
+        try:
+            if test_providers:
+                await self.proxy_client.warmup(min(self.config.global_concurrency, len(tasks)))
+            for next_done in asyncio.as_completed(tasks):
+                index, outcome = await next_done
+                provider, label, test_type = labels[index]
+                if isinstance(outcome, Exception):
+                    outcome = [SmokeTestResult(
+                        provider_name=provider.name,
+                        api_style=provider.api_style.value,
+                        test_type=test_type,
+                        passed=False,
+                        message="Exception during test",
+                        duration_ms=0,
+                        error=str(outcome),
+                    )]
+                outcomes[index] = outcome
                 if self.verbose:
-                    self._print(f"  chat_completions: {'PASS' if r.passed else 'FAIL'} - {r.message}")
+                    for r in outcome:
+                        self._print(f"  {provider.name} {label}: {'PASS' if r.passed else 'FAIL'} - {r.message}")
+        finally:
+            await self.proxy_client.aclose()
 
-            results = self.test_provider_chat_with_system(provider)
-            for r in results:
+        for outcome in outcomes:
+            for r in outcome:
                 suite_result.add_result(r)
-                if self.verbose:
-                    self._print(f"  chat_with_system: {'PASS' if r.passed else 'FAIL'} - {r.message}")
+        for provider in unrouted:
+            self._print(f"  {provider.name}: SKIP - No routing rule found for provider")
+            suite_result.add_result(_no_rule_result(provider, "skipped"))
 
-        suite_result.duration_ms = (time.time() - start_time) * 1000
+        suite_result.duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         # Print summary if verbose
         if self.verbose:
@@ -430,21 +615,11 @@ class SmokeTestSuite:
             self._print(f"Total: {suite_result.total_tests} | Passed: {suite_result.passed} | Failed: {suite_result.failed}")
             self._print(f"Success Rate: {suite_result.success_rate:.1f}%")
 
-            # Group by provider
-            from collections import defaultdict
-            provider_stats = defaultdict(lambda: {'passed': 0, 'failed': 0, 'total': 0})
-            for result in suite_result.results:
-                provider = result.provider_name
-                provider_stats[provider]['total'] += 1
-                if result.passed:
-                    provider_stats[provider]['passed'] += 1
-                else:
-                    provider_stats[provider]['failed'] += 1
-
+            totals, passes = suite_result.provider_stats()
             self._print("\nBy Provider:")
-            for provider, stats in provider_stats.items():
-                success_rate = (stats['passed'] / stats['total'] * 100) if stats['total'] > 0 else 0
-                self._print(f"  {provider}: {stats['passed']}/{stats['total']} passed ({success_rate:.1f}%)")
+            for provider, total in totals.items():
+                passed = passes[provider]
+                self._print(f"  {provider}: {passed}/{total} passed ({passed / total * 100:.1f}%)")
 
         return suite_result
 
@@ -455,11 +630,18 @@ class ProxySmokeTestSuite:
     def __init__(self, config: TestConfig, verbose: bool = False):
         self.config = config
         self.verbose = verbose
-        self.proxy_client = ProxyClient(
+        self.proxy_client = AsyncProxyClient(
             server_url=config.server_url,
             token=config.auth_token,
             timeout=config.timeout,
         )
+        if not verbose:
+            self._print = lambda msg: None
+        # First active rule for each request model
+        self._rule_by_request_model: dict[str, Rule] = {}
+        for rule in config.rules:
+            if rule.active and rule.request_model:
+                self._rule_by_request_model.setdefault(rule.request_model, rule)
 
     def _print(self, msg: str):
         if self.verbose:
@@ -472,12 +654,9 @@ class ProxySmokeTestSuite:
         return self.config.get_any_rule()
 
     def _get_rule_by_request_model(self, request_model: str) -> Optional[Rule]:
-        for rule in self.config.rules:
-            if rule.active and rule.request_model == request_model:
-                return rule
-        return None
+        return self._rule_by_request_model.get(request_model)
 
-    def _run_proxy_chat(self, request_model: str, test_type: str, api_style: str) -> SmokeTestResult:
+    async def _run_proxy_chat(self, request_model: str, test_type: str, api_style: str) -> SmokeTestResult:
         rule = self._get_rule_by_request_model(request_model)
         if not rule:
             return SmokeTestResult(
@@ -492,7 +671,7 @@ class ProxySmokeTestSuite:
 
         test_prompt = self.config.test_prompt
         if api_style == "openai":
-            result = self.proxy_client.chat_completions_openai(
+            result = await self.proxy_client.chat_completions_openai(
                 model=rule.request_model,
                 prompt=test_prompt,
                 scenario=rule.scenario,
@@ -501,7 +680,7 @@ class ProxySmokeTestSuite:
             )
             test_type_label = "chat_completions"
         else:
-            result = self.proxy_client.messages_anthropic(
+            result = await self.proxy_client.messages_anthropic(
                 model=rule.request_model,
                 prompt=test_prompt,
                 scenario=rule.scenario,
@@ -510,73 +689,55 @@ class ProxySmokeTestSuite:
             )
             test_type_label = "messages"
 
-        return SmokeTestResult(
+        return _to_smoke(
+            result,
             provider_name="proxy",
             api_style=api_style,
             test_type=test_type_label,
-            passed=result.success,
-            message=result.message,
-            duration_ms=result.duration_ms,
-            details=result.data or {},
-            http_method=(result.data or {}).get("http_method"),
-            http_url=(result.data or {}).get("http_url"),
-            http_status=(result.data or {}).get("http_status"),
-            error=result.error,
         )
 
-    def test_proxy_list_models_openai(self) -> SmokeTestResult:
+    async def test_proxy_list_models_openai(self) -> SmokeTestResult:
         """Test proxy OpenAI models endpoint."""
+        SmokeRunner.bind(self.proxy_client, self.config)
         rule = self._get_rule_for_scenario("openai")
         scenario = rule.scenario if rule else "openai"
-        result = self.proxy_client.list_models_openai(scenario=scenario)
+        result = await self.proxy_client.list_models_openai(scenario=scenario)
 
-        return SmokeTestResult(
+        return _to_smoke(
+            result,
             provider_name="proxy",
             api_style="openai",
             test_type="list_models",
-            passed=result.success,
-            message=result.message,
-            duration_ms=result.duration_ms,
-            details=result.data or {},
-            http_method=(result.data or {}).get("http_method"),
-            http_url=(result.data or {}).get("http_url"),
-            http_status=(result.data or {}).get("http_status"),
-            error=result.error,
         )
 
-    def test_proxy_list_models_anthropic(self) -> SmokeTestResult:
+    async def test_proxy_list_models_anthropic(self) -> SmokeTestResult:
         """Test proxy Anthropic models endpoint."""
+        SmokeRunner.bind(self.proxy_client, self.config)
         rule = self._get_rule_for_scenario("anthropic")
         scenario = rule.scenario if rule else "anthropic"
-        result = self.proxy_client.list_models_anthropic(scenario=scenario)
+        result = await self.proxy_client.list_models_anthropic(scenario=scenario)
 
-        return SmokeTestResult(
+        return _to_smoke(
+            result,
             provider_name="proxy",
             api_style="anthropic",
             test_type="list_models",
-            passed=result.success,
-            message=result.message,
-            duration_ms=result.duration_ms,
-            details=result.data or {},
-            http_method=(result.data or {}).get("http_method"),
-            http_url=(result.data or {}).get("http_url"),
-            http_status=(result.data or {}).get("http_status"),
-            error=result.error,
         )
 
-    def test_proxy_chat_openai(
+    async def test_proxy_chat_openai(
         self,
         model: Optional[str] = None,
         prompt: Optional[str] = None,
     ) -> SmokeTestResult:
         """Test proxy OpenAI chat endpoint."""
+        SmokeRunner.bind(self.proxy_client, self.config)
         test_prompt = prompt or self.config.test_prompt
 
         rule = self._get_rule_for_scenario("openai")
         scenario = rule.scenario if rule else "openai"
         request_model = rule.request_model if rule and rule.request_model else model
 
-        result = self.proxy_client.chat_completions_openai(
+        result = await self.proxy_client.chat_completions_openai(
             model=request_model or "",
             prompt=test_prompt,
             scenario=scenario,
@@ -584,30 +745,27 @@ class ProxySmokeTestSuite:
             max_tokens=100,
         )
 
-        return SmokeTestResult(
+        return _to_smoke(
+            result,
             provider_name="proxy",
             api_style="openai",
             test_type="chat_completions",
-            passed=result.success,
-            message=result.message,
-            duration_ms=result.duration_ms,
-            details=result.data or {},
-            error=result.error,
         )
 
-    def test_proxy_chat_anthropic(
+    async def test_proxy_chat_anthropic(
         self,
         model: Optional[str] = None,
         prompt: Optional[str] = None,
     ) -> SmokeTestResult:
         """Test proxy Anthropic messages endpoint."""
+        SmokeRunner.bind(self.proxy_client, self.config)
         test_prompt = prompt or self.config.test_prompt
 
         rule = self._get_rule_for_scenario("anthropic")
         scenario = rule.scenario if rule else "anthropic"
         request_model = rule.request_model if rule and rule.request_model else model
 
-        result = self.proxy_client.messages_anthropic(
+        result = await self.proxy_client.messages_anthropic(
             model=request_model or "",
             prompt=test_prompt,
             scenario=scenario,
@@ -615,43 +773,49 @@ class ProxySmokeTestSuite:
             max_tokens=100,
         )
 
-        return SmokeTestResult(
+        return _to_smoke(
+            result,
             provider_name="proxy",
             api_style="anthropic",
             test_type="messages",
-            passed=result.success,
-            message=result.message,
-            duration_ms=result.duration_ms,
-            details=result.data or {},
-            error=result.error,
         )
 
     def run_all_tests(self) -> SmokeTestSuiteResult:
         """Run all proxy smoke tests."""
+        return SmokeRunner.run(self.run_all_tests_async())
+
+    async def run_all_tests_async(self) -> SmokeTestSuiteResult:
+        """Run all proxy smoke tests concurrently."""
+        SmokeRunner.bind(self.proxy_client, self.config)
         suite_result = SmokeTestSuiteResult(suite_name="Proxy Smoke Test Suite")
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
-        self._print("Testing proxy OpenAI models endpoint")
-        result = self.test_proxy_list_models_openai()
-        suite_result.add_result(result)
-        self._print(f"  list_models: {'PASS' if result.passed else 'FAIL'}")
+        targets = [
+            (rule.request_model, "anthropic" if rule.scenario in _ANTHROPIC_SCENARIOS else "openai")
+            for rule in self.config.get_target_rules()
+        ]
+        labels = ["list_models", "anthropic_list_models"] + [request_model for request_model, _ in targets]
 
+        self._print("Testing proxy OpenAI models endpoint")
         self._print("Testing proxy Anthropic models endpoint")
-        result = self.test_proxy_list_models_anthropic()
-        suite_result.add_result(result)
-        self._print(f"  anthropic_list_models: {'PASS' if result.passed else 'FAIL'}")
+        if self.verbose:
+            for request_model, api_style in targets:
+                self._print(f"Testing proxy {api_style} chat endpoint for {request_model}")
 
-        targets = [
-            ("qwen-test", "openai"),
-            ("minimax-test", "anthropic"),
-            ("glm-test", "anthropic"),
-        ]
-        for request_model, api_style in targets:
-            self._print(f"Testing proxy {api_style} chat endpoint for {request_model}")
-            result = self._run_proxy_chat(request_model, "chat", api_style)
+        try:
+            results = await asyncio.gather(
+                self.test_proxy_list_models_openai(),
+                self.test_proxy_list_models_anthropic(),
+                *(self._run_proxy_chat(request_model, "chat", api_style) for request_model, api_style in targets),
+            )
+        finally:
+            await self.proxy_client.aclose()
+
+        for label, result in zip(labels, results):
             suite_result.add_result(result)
-            self._print(f"  {request_model}: {'PASS' if result.passed else 'FAIL'}")
+            if self.verbose:
+                self._print(f"  {label}: {'PASS' if result.passed else 'FAIL'}")
 
-        suite_result.duration_ms = (time.time() - start_time) * 1000
+        suite_result.duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         return suite_result
@@ -13,8 +13,16 @@ Example usage:
 
     automation = TestAutomation()
     automation.run()
+
+    # Or keep one server up for several test passes
+    with TestAutomation() as automation:
+        automation.run_tests()
+        automation.run_tests()
 """
 
+import atexit
+import functools
+import http.client
 import json
 import os
 import shutil
@@ -23,19 +31,47 @@ import socket
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 import logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Server kept running between TestAutomation(reuse_server=True) runs, with the
+# temp directory it was configured from and its port. Stopped at exit.
+_SHARED_SERVER: Optional[subprocess.Popen] = None
+_SHARED_TEMP_DIR: Optional[Path] = None
+_SHARED_TEMP_HANDLE: Optional[tempfile.TemporaryDirectory] = None
+_SHARED_PORT: Optional[int] = None
+# Instance handed out by TestAutomation.get_shared()
+_SHARED_AUTOMATION: Optional["TestAutomation"] = None
+
+# Server and temp directory left running by the last TestAutomation(keep=True)
+# run, for the next keep run of any process to resume
+_SESSION_FILE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "tingly-box" / "last-session.json"
+)
+
+# Endpoint probed to tell whether a server is up
+_READY_PATH = "/tingly/openai/v1/models"
+
+# Background cleanup threads started by TestAutomation._cleanup
+_PENDING_CLEANUPS: List[threading.Thread] = []
+
+# Termination signals turned into SystemExit while a run is in progress
+_EXIT_SIGNALS = tuple(
+    getattr(signal, name) for name in ("SIGTERM", "SIGHUP") if hasattr(signal, name)
+)
+
+
+def _join_pending_cleanups(timeout: float = 15.0) -> None:
+    """Let background cleanups finish before the interpreter exits."""
+    while _PENDING_CLEANUPS:
+        _PENDING_CLEANUPS.pop().join(timeout)
+
 
 @dataclass
 class ServerConfig:
@@ -65,7 +101,7 @@ class TestResult:
 
 class TestAutomation:
     """Automated test infrastructure for tingly-box."""
-    TARGET_PROVIDER_NAMES = {"qwen-test", "glm-test", "minimax-test"}
+    TARGET_PROVIDER_NAMES = ("qwen-test", "glm-test", "minimax-test")
     TARGET_PROVIDER_ALIASES = {
         "qwen-test": "qwen",
         "glm-test": "glm",
@@ -77,7 +113,10 @@ class TestAutomation:
         test_port: int = 12581,
         project_dir: Optional[Path] = None,
         verbose: bool = True,
-        config_path: Optional[str] = None
+        config_path: Optional[str] = None,
+        reuse_server: bool = False,
+        scenarios: Optional[Sequence[str]] = None,
+        keep: bool = False
     ):
         """
         Initialize test automation.
@@ -88,6 +127,18 @@ class TestAutomation:
             verbose: Enable verbose logging
             config_path: Path to an explicit test fixture. The developer's
                 default configuration is never used.
+            reuse_server: Keep the server running after run() and reuse it in
+                later reuse_server runs in this process (which should use the
+                same fixture and scenarios) instead of starting one per run.
+                It is stopped at interpreter exit.
+            scenarios: Target provider scenarios to generate rules for
+                (default: TARGET_PROVIDER_NAMES). All of them are served by
+                one server and tested in one runner pass.
+            keep: Leave the server and temp directory running after the run
+                and record them in the session file, so the next keep run
+                with the same fixture and scenarios, in any process, resumes
+                them instead of starting a server. Cannot be combined with
+                reuse_server.
         """
         selected_config = config_path or os.environ.get("TINGLY_BOX_TEST_CONFIG")
         if not selected_config:
@@ -104,23 +155,67 @@ class TestAutomation:
         self.test_port = self._select_test_port(test_port)
         self.project_dir = project_dir or self._find_project_dir()
         self.verbose = verbose
+        if keep and reuse_server:
+            raise ValueError("keep and reuse_server cannot be combined")
+        self.reuse_server = reuse_server
+        self.keep = keep
+        self._resumed = False
+        self._ready = False
+        self.scenarios = tuple(scenarios) if scenarios else self.TARGET_PROVIDER_NAMES
         self.temp_dir: Optional[Path] = None
+        self._temp_dir_handle: Optional[tempfile.TemporaryDirectory] = None
+        self._test_config_path: Optional[Path] = None
+        self._previous_handlers: Dict = {}
+        self._binary_checked = False
         self.server_process: Optional[subprocess.Popen] = None
+        self._cached_config: Optional[Dict] = None
 
         # Paths
         self.server_binary = self.project_dir / "build" / "tingly-box"
         self.config_template_path = self.project_dir / "tests" / "test_config_port12581.json"
 
-        logger.info(f"Test automation initialized")
-        logger.info(f"Project dir: {self.project_dir}")
-        logger.info(f"Server binary: {self.server_binary}")
-        logger.info(f"Test port: {self.test_port}")
-        logger.info(f"Config path: {self.config_path}")
+        self._narrate(
+            "Test automation initialized",
+            f"  Project dir: {self.project_dir}",
+            f"  Server binary: {self.server_binary}",
+            f"  Test port: {self.test_port}",
+            f"  Scenarios: {', '.join(self.scenarios)}",
+            f"  Config path: {self.config_path}",
+        )
+
+        # Import the test runner in the background so it overlaps server startup
+        self._runner_preload = threading.Thread(
+            target=self._preload_runner, name="tingly-box-runner-import", daemon=True
+        )
+        self._runner_preload.start()
+
+    @staticmethod
+    def _preload_runner() -> None:
+        """Import tests.runner ahead of use; import errors surface in _run_tests."""
+        try:
+            import tests.runner  # noqa: F401
+        except Exception:
+            pass
+
+    def _narrate(self, *lines: str) -> None:
+        """Log progress lines as a single record, only in verbose mode."""
+        if self.verbose and logger.isEnabledFor(logging.INFO):
+            logger.info("\n".join(lines))
 
     def _select_test_port(self, preferred: int) -> int:
-        """Pick an available local port, preferring the provided one."""
+        """Pick an available local port, preferring the provided one.
+
+        The probe socket is closed before the server binds the port, so another
+        process could take it in between. Passing the server an inherited
+        listening socket would close that window, but the server only accepts
+        ``--port`` and binds it itself.
+        """
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                if os.name != "nt":
+                    # Go listeners set SO_REUSEADDR, so a port whose old
+                    # connections are in TIME_WAIT is still usable by the server
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
                 sock.bind(("127.0.0.1", preferred))
                 return preferred
         except OSError:
@@ -131,7 +226,12 @@ class TestAutomation:
     @staticmethod
     def _find_project_dir() -> Path:
         """Find the tingly-box project directory."""
-        current = Path.cwd()
+        return TestAutomation._project_dir_for(Path.cwd())
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _project_dir_for(current: Path) -> Path:
+        """Find the project directory containing ``current``; cached per directory."""
         for parent in [current] + list(current.parents):
             if (parent / "go.mod").exists() and (parent / "internal").exists():
                 return parent
@@ -141,12 +241,17 @@ class TestAutomation:
         """
         Load tingly-box configuration file.
 
+        The parsed configuration is cached, so the fixture is read only once.
+
         Returns:
             Configuration dictionary
 
         Raises:
             RuntimeError: If config file doesn't exist
         """
+        if self._cached_config is not None:
+            return self._cached_config
+
         if not self.config_path.exists():
             raise RuntimeError(
                 f"Config file not found at {self.config_path}\n"
@@ -154,18 +259,36 @@ class TestAutomation:
                 "TINGLY_BOX_TEST_CONFIG"
             )
 
-        logger.info(f"Loading config from: {self.config_path}")
-        with open(self.config_path, 'r') as f:
-            config = json.load(f)
-
-        logger.info(f"Config loaded successfully")
+        config = json.loads(self.config_path.read_bytes())
+        logger.info(f"Loaded config from: {self.config_path}")
+        self._cached_config = config
         return config
 
-    def _create_temp_directory(self) -> Path:
-        """Create and return path to temporary directory."""
-        temp_dir = Path(tempfile.mkdtemp(prefix="tingly-box-test-"))
-        logger.info(f"Created temp directory: {temp_dir}")
-        return temp_dir
+    def _create_temp_directory(self, parent: Optional[Path] = None) -> tempfile.TemporaryDirectory:
+        """
+        Create a temporary directory, optionally inside ``parent``.
+
+        Without a parent, the directory goes to RAM-backed /dev/shm on Linux
+        when it is writable, unless TINGLY_BOX_TEST_TMPFS=0 is set.
+
+        The returned handle removes the directory on ``cleanup()``, or when it
+        is garbage collected if cleanup never ran.
+        """
+        if parent is None:
+            parent = self._tmpfs_dir()
+        handle = tempfile.TemporaryDirectory(prefix="tingly-box-test-", dir=parent, ignore_cleanup_errors=True)
+        logger.info(f"Created temp directory: {handle.name}")
+        return handle
+
+    @staticmethod
+    def _tmpfs_dir() -> Optional[str]:
+        """Return /dev/shm if temp files may go there, else None."""
+        if os.environ.get("TINGLY_BOX_TEST_TMPFS", "1") == "0" or sys.platform != "linux":
+            return None
+        shm = "/dev/shm"
+        if os.path.isdir(shm) and os.access(shm, os.W_OK):
+            return shm
+        return None
 
     def _create_test_config(self, temp_dir: Path) -> Path:
         """
@@ -178,12 +301,11 @@ class TestAutomation:
             Path to created config file
         """
         config_path = temp_dir / "config.json"
-        logger.info("Building temporary test config from explicit fixture")
         config_data = self._generate_config_data()
-        with open(config_path, 'w') as f:
-            json.dump(config_data, f, indent=2)
+        # Compact output: only the server and the runner read this file
+        config_path.write_bytes(json.dumps(config_data, separators=(",", ":")).encode())
 
-        logger.info(f"Created test config: {config_path}")
+        logger.info(f"Created test config from explicit fixture: {config_path}")
         return config_path
 
     def _generate_config_data(self) -> Dict:
@@ -231,18 +353,8 @@ class TestAutomation:
 
     def _extract_providers(self, config: Dict) -> list:
         """Extract enabled providers from the explicit test fixture."""
-        providers = []
-        if config.get("providers_v2"):
-            providers = list(config.get("providers_v2", []))
-        elif config.get("providers"):
-            providers = list(config.get("providers", []))
-
-        enabled = []
-        for provider in providers:
-            if provider.get("enabled") is False:
-                continue
-            enabled.append(provider)
-        return enabled
+        providers = config.get("providers_v2") or config.get("providers") or []
+        return [p for p in providers if p.get("enabled") is not False]
 
     def _build_rules_from_config(self, config: Dict, providers: list) -> tuple[list, set]:
         """Build rules for test config based on fixture providers."""
@@ -283,25 +395,25 @@ class TestAutomation:
                 "smart_enabled": False,
             })
 
-        def find_service_for_provider(provider_uuid: str) -> Optional[Dict]:
-            for rule in config_rules:
-                for service in rule.get("services", []) or []:
-                    if service.get("provider") == provider_uuid and service.get("model"):
-                        return {
-                            "model": service.get("model"),
-                        }
-            return None
-
-        for target_name in self.TARGET_PROVIDER_NAMES:
-            target_key = target_name.lower()
-            alias_key = self.TARGET_PROVIDER_ALIASES.get(target_name, target_name).lower()
+        # First fixture service with a model for each provider UUID
+        service_by_uuid: Dict[str, Dict] = {}
+        for rule in config_rules:
+            for service in rule.get("services", []) or []:
+                if service.get("provider") and service.get("model"):
+                    service_by_uuid.setdefault(service["provider"], {"model": service["model"]})
 
+        targets = [
+            (name, name.lower(), self.TARGET_PROVIDER_ALIASES.get(name, name).lower())
+            for name in self.scenarios
+        ]
+        for target_name, target_key, alias_key in targets:
             candidates = []
             target_provider = provider_lookup.get(target_key)
             if target_provider:
                 candidates.append(target_provider)
-            alias_provider = provider_lookup.get(alias_key)
-            if alias_provider and alias_provider not in candidates:
+            # Dedupe by identity so provider dicts are never compared by value
+            alias_provider = provider_lookup.get(alias_key) if alias_key != target_key else None
+            if alias_provider and alias_provider is not target_provider:
                 candidates.append(alias_provider)
 
             if not candidates:
@@ -312,7 +424,7 @@ class TestAutomation:
             model = None
             for candidate in candidates:
                 candidate_uuid = candidate.get("uuid")
-                service_info = find_service_for_provider(candidate_uuid)
+                service_info = service_by_uuid.get(candidate_uuid)
                 if service_info:
                     provider = candidate
                     model = service_info["model"]
@@ -378,7 +490,9 @@ class TestAutomation:
         return scenarios
 
     def _check_server_binary(self) -> None:
-        """Check if server binary exists."""
+        """Check if server binary exists; a found binary is not checked again."""
+        if self._binary_checked:
+            return
         if not self.server_binary.exists():
             raise RuntimeError(
                 f"Server binary not found at {self.server_binary}\n"
@@ -388,6 +502,7 @@ class TestAutomation:
                 f"Or use existing binary at {self.server_binary}"
             )
         logger.info(f"Server binary found: {self.server_binary}")
+        self._binary_checked = True
 
     def _start_server(self, config_path: Path, log_path: Path) -> subprocess.Popen:
         """
@@ -400,74 +515,107 @@ class TestAutomation:
         Returns:
             Started process object
         """
-        logger.info(f"Starting server on port {self.test_port}")
-        logger.info(f"Config: {config_path}")
-        logger.info(f"Log: {log_path}")
+        self._narrate(
+            f"Starting server on port {self.test_port}",
+            f"  Config: {config_path}",
+            f"  Log: {log_path}",
+        )
 
-        with open(log_path, 'w') as log_file:
+        # Raw close-on-exec fd: the parent never writes to the log, so no file
+        # object is needed, and the fd cannot leak into later subprocesses
+        log_fd = os.open(
+            log_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0), 0o644
+        )
+        try:
+            # Python opens fds non-inheritable (PEP 446), so the child needs no
+            # close-all-fds pass; only the log fd is passed on as stdout/stderr.
+            # cwd rules out the posix_spawn path, but CPython 3.10+ still spawns
+            # through vfork here, so the parent's memory is never copied.
             process = subprocess.Popen(
                 [
                     str(self.server_binary),
                     "start",
                     "--config-dir", str(self.temp_dir),
                     "--port", str(self.test_port),
-                "--browser", "false"
+                    "--browser", "false"
                 ],
-                stdout=log_file,
+                stdout=log_fd,
                 stderr=subprocess.STDOUT,
-                cwd=str(self.temp_dir)
+                cwd=str(self.temp_dir),
+                close_fds=False
             )
+        finally:
+            os.close(log_fd)
 
         logger.info("Server started")
         return process
 
-    def _wait_for_server(self, max_attempts: int = 30) -> bool:
+    def _wait_for_server(self, timeout: float = 30.0, interval: float = 0.01, max_interval: float = 0.25) -> bool:
         """
         Wait for server to be ready.
 
+        Probes the models endpoint over one keep-alive HTTP connection that is
+        reopened only after a failed attempt. Until the server listens, each
+        attempt fails at TCP connect, so the loop is a plain connect probe
+        that turns into the HTTP check once the port accepts. Any HTTP
+        response, whatever its status, means the server's router is up, so
+        the probe carries no credentials and does not need the config's
+        model token.
+
         Args:
-            max_attempts: Maximum number of attempts
+            timeout: Maximum number of seconds to wait
+            interval: Seconds to sleep after the first failed attempt; grown
+                1.7x after each further failure, up to max_interval
+            max_interval: Longest sleep between attempts
 
         Returns:
             True if server is ready, False otherwise
         """
-        import urllib.request
+        path = _READY_PATH
+        logger.info(f"Waiting for server to be ready at http://localhost:{self.test_port}{path}")
+        conn = http.client.HTTPConnection("localhost", self.test_port, timeout=0.5)
+        deadline = time.monotonic() + timeout
+        delay = interval
 
-        url = f"http://localhost:{self.test_port}/tingly/openai/v1/models"
-        logger.info(f"Waiting for server to be ready at {url}")
-        model_token = ""
         try:
-            config = self._load_config()
-            model_token = config.get("model_token", "")
-        except Exception:
-            model_token = ""
-
-        for attempt in range(1, max_attempts + 1):
-            try:
-                req = urllib.request.Request(url)
-                if model_token:
-                    req.add_header("Authorization", f"Bearer {model_token}")
-                with urllib.request.urlopen(req, timeout=2) as response:
-                    if response.status in (200, 401):
-                        logger.info("✓ Server is ready!")
-                        return True
-            except urllib.error.HTTPError as e:
-                # Any HTTP response means server is up (even if auth/route fails)
-                logger.info(f"✓ Server is ready (HTTP {e.code})!")
-                return True
-                if attempt == max_attempts:
-                    logger.error(f"Server failed to start after {max_attempts} attempts")
-                    return False
-                logger.debug(f"Attempt {attempt}/{max_attempts} failed: {e}")
-                time.sleep(1)
-            except Exception as e:
-                if attempt == max_attempts:
-                    logger.error(f"Server failed to start after {max_attempts} attempts")
-                    return False
-                logger.debug(f"Attempt {attempt}/{max_attempts} failed: {e}")
-                time.sleep(1)
+            while True:
+                try:
+                    conn.request("GET", path)
+                    response = conn.getresponse()
+                    response.read()
+                    logger.info(f"✓ Server is ready (HTTP {response.status})!")
+                    return True
+                except (OSError, http.client.HTTPException) as e:
+                    conn.close()
+                    if self.server_process is not None and self.server_process.poll() is not None:
+                        logger.error(f"Server exited with code {self.server_process.returncode}")
+                        return False
+                    if time.monotonic() >= deadline:
+                        logger.error(f"Server failed to start within {timeout:g}s")
+                        return False
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Server not ready yet: {e}")
+                    time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+                    delay = min(delay * 1.7, max_interval)
+        finally:
+            conn.close()
 
-        return False
+    @staticmethod
+    def _log_server_output(log_path: Path, max_bytes: int = 64 * 1024) -> None:
+        """Log the server log line by line, limited to its last ``max_bytes``."""
+        try:
+            with open(log_path, "rb") as f:
+                size = f.seek(0, os.SEEK_END)
+                f.seek(max(0, size - max_bytes))
+                if size > max_bytes:
+                    f.readline()  # skip the partial first line
+                    logger.info(f"Server output (last {max_bytes // 1024} KiB):")
+                else:
+                    logger.info("Server output:")
+                for line in f:
+                    logger.info(line.decode("utf-8", "replace").rstrip())
+        except OSError as e:
+            logger.warning(f"Could not read server log: {e}")
 
     def _run_tests(self, config_path: Path) -> TestResult:
         """
@@ -479,22 +627,19 @@ class TestAutomation:
         Returns:
             TestResult with exit code and duration
         """
-        logger.info("Running test suite")
-
         # Create permanent output directory in tests/ with timestamp
         from datetime import datetime
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         permanent_output_dir = self.project_dir / "tests" / "test_results" / timestamp
         permanent_output_dir.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Results will be saved to: {permanent_output_dir}")
+        logger.info(f"Running test suite; results will be saved to: {permanent_output_dir}")
 
         start_time = time.time()
 
         # Run tests using Python module against the test server
         # Output directly to permanent directory
         server_url = f"http://localhost:{self.test_port}"
-        sys.argv = [
-            "tests.runner",
+        argv = [
             "--all",
             "--html",
             "--save",
@@ -505,8 +650,9 @@ class TestAutomation:
         ]
 
         try:
+            self._runner_preload.join()
             from tests.runner import main as run_tests
-            exit_code = run_tests()
+            exit_code = run_tests(argv)
             duration_ms = (time.time() - start_time) * 1000
             logger.info(f"Tests completed with exit code: {exit_code}")
 
@@ -525,89 +671,358 @@ class TestAutomation:
             )
 
     def _cleanup(self) -> None:
-        """Clean up resources."""
+        """Clean up resources.
+
+        The server is sent SIGTERM here; waiting for it to exit and removing the
+        temp directory happen on a background thread that is joined at exit.
+        """
+        if self.keep:
+            self._keep_or_discard_session()
+            return
+
         logger.info("Cleaning up resources")
 
-        # Stop server if running
-        if self.server_process and self.server_process.poll() is None:
+        # Stop server if running, unless it is kept for reuse
+        server = None
+        if (
+            self.server_process
+            and self.server_process is not _SHARED_SERVER
+            and self.server_process.poll() is None
+        ):
             try:
                 self.server_process.terminate()
-                self.server_process.wait(timeout=10)
-                logger.info("Server stopped")
+                server = self.server_process
             except Exception as e:
                 logger.warning(f"Failed to stop server: {e}")
 
-        # Remove temp directory
-        if self.temp_dir and self.temp_dir.exists():
+        # Remove temp directory, unless the shared server was configured from it
+        temp_dir = None
+        if self._temp_dir_handle and self._temp_dir_handle is not _SHARED_TEMP_HANDLE:
             logger.info(f"Removing temp directory: {self.temp_dir}")
-            shutil.rmtree(self.temp_dir)
+            temp_dir = self._temp_dir_handle
 
-    def run(self) -> int:
+        if server or temp_dir:
+            thread = threading.Thread(target=self._finish_cleanup, args=(server, temp_dir), daemon=True)
+            thread.start()
+            _PENDING_CLEANUPS.append(thread)
+            # Re-register so the join runs before the exit-time finalizers of
+            # TemporaryDirectory handles created since (atexit runs LIFO)
+            atexit.unregister(_join_pending_cleanups)
+            atexit.register(_join_pending_cleanups)
+
+    @staticmethod
+    def _finish_cleanup(
+        server: Optional[subprocess.Popen], temp_dir: Optional[tempfile.TemporaryDirectory]
+    ) -> None:
+        """Wait for a terminated server to exit, then remove its temp directory."""
+        if server is not None:
+            try:
+                server.wait(timeout=10)
+                logger.info("Server stopped")
+            except subprocess.TimeoutExpired:
+                server.kill()
+                server.wait()
+                logger.warning("Server did not exit after SIGTERM; killed it")
+        if temp_dir is not None:
+            temp_dir.cleanup()
+
+    def _keep_or_discard_session(self) -> None:
+        """Record a ready kept server in the session file, else stop it and remove its directory."""
+        if self._resumed:
+            return
+        alive = self.server_process is not None and self.server_process.poll() is None
+        if alive and self._ready:
+            self._persist_session()
+            return
+        if alive:
+            # Started but never became ready; the next keep run would not adopt it
+            self.server_process.terminate()
+            self._finish_cleanup(self.server_process, None)
+        if self.temp_dir is not None:
+            logger.info(f"Removing temp directory: {self.temp_dir}")
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _persist_session(self) -> None:
+        session = {
+            "pid": self.server_process.pid,
+            "port": self.test_port,
+            "temp_dir": str(self.temp_dir),
+            "config": str(self._test_config_path),
+            "fixture": str(self.config_path),
+            "fixture_mtime_ns": self._fixture_mtime_ns(),
+            "scenarios": list(self.scenarios),
+        }
+        try:
+            _SESSION_FILE.parent.mkdir(parents=True, exist_ok=True)
+            _SESSION_FILE.write_bytes(json.dumps(session).encode())
+        except OSError as e:
+            logger.warning(f"Could not record kept session in {_SESSION_FILE}: {e}")
+            return
+        logger.info(
+            f"Kept server (pid {self.server_process.pid}) running on port {self.test_port}; "
+            f"temp directory {self.temp_dir}"
+        )
+
+    def _try_resume_session(self) -> bool:
         """
-        Execute the complete test automation workflow.
+        Adopt the server recorded by an earlier keep run, if it still fits.
 
         Returns:
-            Exit code (0 for success, non-zero for failure)
+            True if the recorded server matches this fixture and scenarios and
+            still answers, False otherwise
         """
-        logger.info("=" * 60)
-        logger.info("Tingly-Box Automated Test Runner")
-        logger.info("=" * 60)
-        logger.info("")
+        try:
+            session = json.loads(_SESSION_FILE.read_bytes())
+        except (OSError, ValueError):
+            return False
+
+        config_path = Path(session.get("config", ""))
+        port = session.get("port")
+        if not isinstance(port, int) or not config_path.is_file() or not self._server_responds(port):
+            return False
+        if (
+            session.get("fixture") != str(self.config_path)
+            or session.get("fixture_mtime_ns") != self._fixture_mtime_ns()
+            or session.get("scenarios") != list(self.scenarios)
+        ):
+            logger.warning(
+                f"Kept server on port {port} (pid {session.get('pid')}) was started for a "
+                "different fixture or scenarios; starting a new one. Stop the old one manually."
+            )
+            return False
 
+        self.test_port = port
+        self.temp_dir = Path(session["temp_dir"])
+        self._test_config_path = config_path
+        self._resumed = True
+        return True
+
+    def _fixture_mtime_ns(self) -> Optional[int]:
         try:
-            # Step 1: Create temp directory
-            logger.info("Step 1: Creating temporary directory")
-            self.temp_dir = self._create_temp_directory()
-            logger.info(f"✓ Temp directory created: {self.temp_dir}")
-            logger.info("")
-
-            # Step 2: Create test config
-            logger.info("Step 2: Creating test configuration")
-            config_path = self._create_test_config(self.temp_dir)
-            logger.info(f"✓ Test config created: {config_path}")
-            logger.info("")
-
-            # Step 3: Check server binary
-            logger.info("Step 3: Checking server binary")
-            self._check_server_binary()
-            logger.info("✓ Server binary check passed")
-            logger.info("")
-
-            # Step 4: Start server
-            logger.info("Step 4: Starting server")
-            log_path = self.temp_dir / "server.log"
-            self.server_process = self._start_server(config_path, log_path)
-            logger.info("")
-
-            # Step 5: Wait for server
-            logger.info("Step 5: Waiting for server to be ready")
-            if not self._wait_for_server():
-                logger.error("Server failed to start")
-                logger.info(f"Server log: {log_path}")
-                with open(log_path) as f:
-                    logger.info("Server output:")
-                    logger.info(f.read())
-                return 1
-            logger.info("")
+            return self.config_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def _server_responds(port: int) -> bool:
+        """Return True if something answers HTTP on the port's ready endpoint."""
+        conn = http.client.HTTPConnection("localhost", port, timeout=0.5)
+        try:
+            conn.request("GET", _READY_PATH)
+            conn.getresponse().read()
+            return True
+        except (OSError, http.client.HTTPException):
+            return False
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _shared_server_alive() -> bool:
+        return _SHARED_SERVER is not None and _SHARED_SERVER.poll() is None
+
+    def _share_server(self) -> None:
+        """Keep this run's server running for later reuse_server runs."""
+        global _SHARED_SERVER, _SHARED_TEMP_DIR, _SHARED_TEMP_HANDLE, _SHARED_PORT
+        if _SHARED_SERVER is None:
+            atexit.register(TestAutomation._shutdown_shared)
+        elif _SHARED_TEMP_HANDLE:
+            # The previous shared server has exited
+            _SHARED_TEMP_HANDLE.cleanup()
+        _SHARED_SERVER = self.server_process
+        _SHARED_TEMP_DIR = self.temp_dir
+        _SHARED_TEMP_HANDLE = self._temp_dir_handle
+        _SHARED_PORT = self.test_port
+        logger.info(f"Server on port {self.test_port} kept running for reuse")
+
+    @staticmethod
+    def _shutdown_shared() -> None:
+        """Stop the shared server and remove its temp directory."""
+        global _SHARED_SERVER, _SHARED_TEMP_DIR, _SHARED_TEMP_HANDLE, _SHARED_PORT
+        server, temp_dir = _SHARED_SERVER, _SHARED_TEMP_HANDLE
+        _SHARED_SERVER = _SHARED_TEMP_DIR = _SHARED_TEMP_HANDLE = _SHARED_PORT = None
+        if server and server.poll() is None:
+            server.terminate()
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+        if temp_dir:
+            temp_dir.cleanup()
+
+    def __enter__(self) -> "TestAutomation":
+        """Set up the temp directory, test config and server (steps 1-5)."""
+        self._previous_handlers = self._install_signal_handlers()
+        try:
+            self._prepare()
+        except BaseException:
+            self._restore_signal_handlers(self._previous_handlers)
+            raise
+        return self
+
+    def _prepare(self) -> None:
+        """Run _setup, cleaning up and raising if the server is not ready."""
+        try:
+            ready = self._setup()
+        except BaseException:
+            self._cleanup()
+            raise
+        if not ready:
+            self._cleanup()
+            raise RuntimeError("Server failed to start")
 
-            # Step 6: Run tests
-            logger.info("Step 6: Running tests")
-            result = self._run_tests(config_path)
-            logger.info(f"✓ Tests completed in {result.duration_ms:.2f}ms")
-            logger.info("")
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self._cleanup()
+        finally:
+            self._restore_signal_handlers(self._previous_handlers)
 
-            # Step 7: Display results
-            self._display_results(result)
+    @staticmethod
+    def _install_signal_handlers() -> Dict:
+        """
+        Make SIGTERM and SIGHUP raise SystemExit, so cleanup code still runs.
+
+        Only possible from the main thread; elsewhere nothing is installed.
 
-            return result.exit_code
+        Returns:
+            The replaced handlers, for _restore_signal_handlers
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return {}
+        return {sig: signal.signal(sig, TestAutomation._exit_on_signal) for sig in _EXIT_SIGNALS}
+
+    @staticmethod
+    def _restore_signal_handlers(previous: Dict) -> None:
+        for sig, handler in previous.items():
+            signal.signal(sig, handler if handler is not None else signal.SIG_DFL)
+
+    @staticmethod
+    def _exit_on_signal(signum: int, frame) -> None:
+        logger.warning(f"Received {signal.Signals(signum).name}, cleaning up")
+        raise SystemExit(128 + signum)
+
+    @classmethod
+    def get_shared(cls, **kwargs) -> "TestAutomation":
+        """
+        Return a process-wide automation whose server is already running.
+
+        The instance is created and set up on first use, or again if its
+        server has exited; kwargs are only used then. Its server and temp
+        directory are released at interpreter exit.
+        """
+        global _SHARED_AUTOMATION
+        if _SHARED_AUTOMATION is None or not cls._shared_server_alive():
+            # No signal handlers here: nothing would restore them, and the
+            # _shutdown_shared atexit hook releases the server
+            automation = cls(reuse_server=True, **kwargs)
+            automation._prepare()
+            _SHARED_AUTOMATION = automation
+        return _SHARED_AUTOMATION
+
+    def _setup(self) -> bool:
+        """
+        Prepare a run: temp directory, test config and a ready server.
+
+        Returns:
+            False if the server failed to start, True otherwise
+        """
+        self._narrate("=" * 60, "Tingly-Box Automated Test Runner", "=" * 60, "")
+        self._ready = False
+
+        if self.keep and self._try_resume_session():
+            self._narrate(f"Steps 1-5: Resuming kept server on port {self.test_port}", "")
+            self._ready = True
+            return True
+
+        reuse = self.reuse_server and self._shared_server_alive()
+        if reuse:
+            # Tests must target the shared server's port and rules
+            self.test_port = _SHARED_PORT
+
+        # Step 1: Create temp directory
+        self._narrate("Step 1: Creating temporary directory")
+        if self.keep:
+            # A kept directory outlives this process, so it has no cleanup handle
+            self.temp_dir = Path(tempfile.mkdtemp(prefix="tingly-box-test-", dir=self._tmpfs_dir()))
+        else:
+            self._temp_dir_handle = self._create_temp_directory(_SHARED_TEMP_DIR if reuse else None)
+            self.temp_dir = Path(self._temp_dir_handle.name)
+        self._narrate(f"✓ Temp directory created: {self.temp_dir}", "")
+
+        # Step 2: Create test config
+        self._narrate("Step 2: Creating test configuration")
+        self._test_config_path = self._create_test_config(self.temp_dir)
+        self._narrate(f"✓ Test config created: {self._test_config_path}", "")
+
+        if reuse:
+            self._narrate(f"Steps 3-5: Reusing running server on port {self.test_port}", "")
+            self._ready = True
+            return True
+
+        # Step 3: Check server binary
+        self._narrate("Step 3: Checking server binary")
+        self._check_server_binary()
+        self._narrate("✓ Server binary check passed", "")
+
+        # Step 4: Start server
+        self._narrate("Step 4: Starting server")
+        log_path = self.temp_dir / "server.log"
+        self.server_process = self._start_server(self._test_config_path, log_path)
+
+        # Step 5: Wait for server
+        self._narrate("Step 5: Waiting for server to be ready")
+        if not self._wait_for_server():
+            logger.error("Server failed to start")
+            logger.info(f"Server log: {log_path}")
+            self._log_server_output(log_path)
+            return False
+        if self.reuse_server:
+            self._share_server()
+        self._ready = True
+        return True
+
+    def run_tests(self) -> int:
+        """
+        Run the test suite against the prepared server (steps 6-7).
+
+        May be called repeatedly inside one ``with`` block.
+
+        Returns:
+            Exit code of the test runner
+        """
+        if self._test_config_path is None:
+            raise RuntimeError("run_tests() needs a prepared server; use 'with TestAutomation(...)'")
+
+        # Step 6: Run tests
+        self._narrate("Step 6: Running tests")
+        result = self._run_tests(self._test_config_path)
+        self._narrate(f"✓ Tests completed in {result.duration_ms:.2f}ms", "")
+
+        # Step 7: Display results
+        self._display_results(result)
+
+        return result.exit_code
+
+    def run(self) -> int:
+        """
+        Execute the complete test automation workflow.
+
+        Returns:
+            Exit code (0 for success, non-zero for failure)
+        """
+        previous_handlers = self._install_signal_handlers()
+        try:
+            if not self._setup():
+                return 1
+            return self.run_tests()
 
         except Exception as e:
             logger.exception(f"Test automation failed: {e}")
             return 1
 
         finally:
-            # Always cleanup
+            # Always cleanup, also when SIGTERM/SIGHUP ended the run
             self._cleanup()
+            self._restore_signal_handlers(previous_handlers)
 
     def _display_results(self, result: TestResult) -> None:
         """
@@ -616,23 +1031,25 @@ class TestAutomation:
         Args:
             result: TestResult object
         """
-        logger.info("=" * 60)
-        logger.info("Test Results")
-        logger.info("=" * 60)
-        logger.info("")
-        logger.info(f"Exit Code: {result.exit_code}")
-        logger.info(f"Duration: {result.duration_ms:.2f}ms")
-        logger.info(f"Results Directory: {result.log_path}")
-        logger.info("")
+        lines = [
+            "=" * 60,
+            "Test Results",
+            "=" * 60,
+            "",
+            f"Exit Code: {result.exit_code}",
+            f"Duration: {result.duration_ms:.2f}ms",
+            f"Results Directory: {result.log_path}",
+            "",
+        ]
 
         # List saved files
         if result.log_path.exists():
-            result_files = list(result.log_path.glob("*"))
+            result_files = sorted(result.log_path.glob("*"))
             if result_files:
-                logger.info("Saved files:")
-                for file in sorted(result_files):
-                    logger.info(f"  - {file.name}")
-        logger.info("")
+                lines.append("Saved files:")
+                lines.extend(f"  - {file.name}" for file in result_files)
+        lines.append("")
+        logger.info("\n".join(lines))
 
         # Display summary
         if result.exit_code == 0:
@@ -640,9 +1057,13 @@ class TestAutomation:
         else:
             logger.warning("⚠ Tests completed with errors")
 
-        logger.info("")
-        logger.info("Note: Test results are saved permanently in tests/test_results/")
-        logger.info("      Temp directory will be removed after script exits")
+        self._narrate(
+            "",
+            "Note: Test results are saved permanently in tests/test_results/",
+            "      Server and temp directory are kept for the next --keep run"
+            if self.keep
+            else "      Temp directory will be removed after script exits",
+        )
 
 
 def main() -> int:
@@ -664,6 +1085,20 @@ def main() -> int:
         default=None,
         help="Path to an isolated test fixture (or set TINGLY_BOX_TEST_CONFIG)"
     )
+    parser.add_argument(
+        "--scenario",
+        dest="scenarios",
+        action="append",
+        default=None,
+        help="Target provider scenario to test; repeat for several "
+             f"(default: {', '.join(TestAutomation.TARGET_PROVIDER_NAMES)})"
+    )
+    parser.add_argument(
+        "--keep",
+        action="store_true",
+        help="Keep the server and temp directory running after the run and "
+             "resume them in the next --keep run with the same fixture"
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -678,11 +1113,20 @@ def main() -> int:
 
     args = parser.parse_args()
 
+    # Configure logging here so importing this module leaves the root logger alone
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+
     try:
         automation = TestAutomation(
             test_port=args.port,
             verbose=args.verbose and not args.quiet,
-            config_path=args.config_path
+            config_path=args.config_path,
+            scenarios=args.scenarios,
+            keep=args.keep
         )
         return automation.run()
     except KeyboardInterrupt:
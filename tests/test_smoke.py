@@ -0,0 +1,81 @@
+"""
+Event loop handling of the smoke suites, against a local fake proxy.
+
+Run with: python -m pytest tests/test_smoke.py
+"""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from tests.config import Provider, Rule, TestConfig as Config
+from tests.smoke import ProxySmokeTestSuite, SmokeRunner, SmokeTestSuite
+
+
+class _FakeProxyHandler(BaseHTTPRequestHandler):
+    """Answers every request with a 200 JSON body that fits all proxy endpoints."""
+
+    protocol_version = "HTTP/1.1"
+    body = json.dumps({"id": "fake", "model": "fake", "data": [], "choices": [{}]}).encode()
+
+    def _reply(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(self.body)
+
+    do_GET = do_POST = do_HEAD = _reply
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def config():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeProxyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    provider = Provider(uuid="p1", name="qwen", models=["qwen-plus"])
+    rule = Rule(uuid="r1", scenario="openai", request_model="qwen-test", services=[{"provider": "p1"}])
+    yield Config(
+        providers=[provider],
+        rules=[rule],
+        server_url=f"http://127.0.0.1:{server.server_address[1]}",
+        timeout=5,
+    )
+    SmokeRunner.close()
+    server.shutdown()
+    server.server_close()
+
+
+def test_async_api_on_fresh_loop_after_sync_run(config):
+    suite = SmokeTestSuite(config)
+    assert suite.run_all_tests().failed == 0
+
+    results = asyncio.run(suite.test_provider_chat(config.providers[0]))
+    assert [r.passed for r in results] == [True]
+
+    proxy_suite = ProxySmokeTestSuite(config)
+    assert proxy_suite.run_all_tests().failed == 0
+    assert asyncio.run(proxy_suite.test_proxy_chat_openai()).passed
+
+
+def test_sync_run_after_async_run(config):
+    suite = SmokeTestSuite(config)
+    assert asyncio.run(suite.run_all_tests_async()).failed == 0
+    assert suite.run_all_tests().failed == 0
+
+
+def test_proxy_targets_follow_config_rules(config):
+    config.rules.append(Rule(uuid="r2", scenario="openai", request_model="qwen-test-xform", services=[{"provider": "p1"}]))
+    result = ProxySmokeTestSuite(config).run_all_tests()
+    # Both list_models endpoints plus one chat for the only target rule
+    assert (result.total_tests, result.failed) == (3, 0)
@@ -2,98 +2,218 @@
 """Test script for web_search functionality using explicit tool calls."""
 
 import os
+import functools
 import json
+import shutil
+import socket
 import sys
 import uuid
 import subprocess
 import tempfile
+import threading
 import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from importlib.util import find_spec
 
 # Install requirements: pip install openai requests
-from openai import OpenAI
+import httpx
+import requests
+from openai import DefaultHttpxClient, OpenAI
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1 without it
+HTTP2_AVAILABLE = find_spec("h2") is not None
 
 # Get current date for time-sensitive queries
 CURRENT_DATE = datetime.now().strftime("%Y-%m-%d")
 
 # Configuration
-BASE_URL = "http://127.0.0.1:12580"
+DEFAULT_PORT = 12580
+BASE_URL = f"http://127.0.0.1:{DEFAULT_PORT}"
 OPENAI_ENDPOINT = f"{BASE_URL}/tingly/openai/v1"
 ANTHROPIC_ENDPOINT = f"{BASE_URL}/tingly/anthropic/v1"
-CONFIG_DIR = os.environ.get("TINGLY_BOX_TEST_CONFIG_DIR", "")
-CONFIG_PATH = os.path.join(CONFIG_DIR, "config.json") if CONFIG_DIR else ""
-DEFAULT_SERVER_BIN = os.path.abspath(
-    os.path.join(os.path.dirname(__file__), "..", "build", "tingly-box")
+# Print full tracebacks for unexpected test errors
+DEBUG = os.environ.get("TINGLY_DEBUG", "").lower() in ("1", "true")
+
+# Request pieces shared by the tool-call tests; never mutated
+GO_VERSION_PROMPT = f"What is the latest stable version of Go (Golang)? (Today is {CURRENT_DATE})"
+GO_VERSION_MESSAGE = {"role": "user", "content": GO_VERSION_PROMPT}
+WEB_SEARCH_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "web_search",
+            "description": "Search the web for current information",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "The search query"
+                    },
+                    "count": {
+                        "type": "integer",
+                        "description": "Number of results to return (default: 5)"
+                    }
+                },
+                "required": ["query"]
+            }
+        }
+    }
+]
+# Client-side web_search result; only the query varies, and it is filled in
+# as a JSON-escaped string body
+_FALLBACK_RESULT_TMPL = (
+    '{"results": [{"title": "Search result for: %s", "url": "https://example.com", '
+    '"snippet": "This is a client-side fallback result."}]}'
 )
 
 
 def load_model_token(path: str) -> str:
-    with open(path, "r", encoding="utf-8") as f:
-        cfg = json.load(f)
+    cfg = _read_config(path)
     token = cfg.get("model_token")
     if not token:
         raise RuntimeError("model_token not found in config.json")
     return token
 
 
+@functools.lru_cache(maxsize=1)
+def _config_dir() -> str:
+    """Return the isolated test config directory, or "" if unset."""
+    return os.environ.get("TINGLY_BOX_TEST_CONFIG_DIR", "")
+
+
+@functools.lru_cache(maxsize=1)
+def _config_path() -> str:
+    config_dir = _config_dir()
+    return os.path.join(config_dir, "config.json") if config_dir else ""
+
+
+@functools.lru_cache(maxsize=1)
+def _default_server_bin() -> str:
+    return os.path.abspath(
+        os.path.join(os.path.dirname(__file__), "..", "build", "tingly-box")
+    )
+
+
+@functools.lru_cache(maxsize=1)
 def resolve_api_key() -> str:
+    """Return the proxy API key, resolved once per process."""
     token = os.environ.get("TINGLY_BOX_API_KEY")
     if token:
         return token
-    if not CONFIG_PATH:
+    config_path = _config_path()
+    if not config_path:
         raise RuntimeError(
             "Set TINGLY_BOX_API_KEY or point TINGLY_BOX_TEST_CONFIG_DIR at an "
             "isolated test configuration directory"
         )
-    return load_model_token(CONFIG_PATH)
-
-
-API_KEY = os.environ.get("TINGLY_BOX_API_KEY", "")
-
-
-def test_openai_explicit_tool_call(label=""):
+    return load_model_token(config_path)
+
+
+# OpenAI clients shared by all tests, one per server, so their connection
+# pools survive across tests
+_OPENAI_CLIENTS = {}
+
+
+def _get_openai_client(base_url: str = BASE_URL) -> OpenAI:
+    """Return the shared OpenAI client for a server, creating it on first use."""
+    client = _OPENAI_CLIENTS.get(base_url)
+    if client is None:
+        client = _OPENAI_CLIENTS[base_url] = OpenAI(
+            base_url=f"{base_url}/tingly/openai/v1",
+            api_key=resolve_api_key(),
+            # httpx negotiates HTTP/2 via TLS ALPN, so plain-http servers
+            # keep using pooled HTTP/1.1 connections
+            http_client=DefaultHttpxClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=10, max_keepalive_connections=10, keepalive_expiry=30
+                ),
+            ),
+        )
+    return client
+
+
+# Session for the raw Anthropic-style requests, keeping connections alive
+_SESSION = requests.Session()
+_SESSION.mount("http://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_SESSION.headers.update({
+    "Content-Type": "application/json",
+    "anthropic-version": "2023-06-01",
+})
+
+
+@functools.lru_cache(maxsize=1)
+def _auth_headers() -> dict:
+    """Return the per-request auth header, built once; treat as read-only."""
+    return {"Authorization": f"Bearer {resolve_api_key()}"}
+
+
+def _read_stream(stream) -> tuple:
+    """Collect a streamed chat completion up to its finish_reason.
+
+    Returns (finish_reason, content, tool_calls), with the tool calls
+    assembled from their deltas into the request message format.
+    """
+    finish_reason = None
+    content = []
+    calls = {}
+    with stream:
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            choice = chunk.choices[0]
+            delta = choice.delta
+            if delta.content:
+                content.append(delta.content)
+            for tc in delta.tool_calls or ():
+                call = calls.setdefault(
+                    tc.index, {"id": "", "type": "function", "function": {"name": "", "arguments": ""}}
+                )
+                if tc.id:
+                    call["id"] = tc.id
+                if tc.function:
+                    if tc.function.name:
+                        call["function"]["name"] = tc.function.name
+                    if tc.function.arguments:
+                        call["function"]["arguments"] += tc.function.arguments
+            if choice.finish_reason:
+                # Stop at the end of the answer; nothing after it is needed
+                finish_reason = choice.finish_reason
+                break
+    return finish_reason, "".join(content), [calls[i] for i in sorted(calls)]
+
+
+_OUTPUT_LOCK = threading.Lock()
+
+
+def _emit(lines: list) -> None:
+    """Write buffered output lines with one write, so concurrent tests
+    don't interleave line by line."""
+    if not lines:
+        return
+    with _OUTPUT_LOCK:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+
+def test_openai_explicit_tool_call(label="", base_url=BASE_URL):
     """Test OpenAI-style endpoint with tool definitions - let provider decide."""
-    print("\n" + "="*70)
-    print(f"Testing OpenAI-style endpoint with tool definitions {label}")
-    print("Expected: Provider calls web_search, server intercepts and executes locally")
-    print("="*70)
-
-    client = OpenAI(
-        base_url=OPENAI_ENDPOINT,
-        api_key=API_KEY
-    )
-
-    # Define the tool
-    tools = [
-        {
-            "type": "function",
-            "function": {
-                "name": "web_search",
-                "description": "Search the web for current information",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "The search query"
-                        },
-                        "count": {
-                            "type": "integer",
-                            "description": "Number of results to return (default: 5)"
-                        }
-                    },
-                    "required": ["query"]
-                }
-            }
-        }
+    # Output is buffered and written once per iteration
+    log = [
+        "\n" + "="*70,
+        f"Testing OpenAI-style endpoint with tool definitions {label}",
+        "Expected: Provider calls web_search, server intercepts and executes locally",
+        "="*70,
+        "\nSending request to qwen-plus with web_search tool defined...",
+        f"  User: {GO_VERSION_PROMPT}",
     ]
 
-    messages = [
-        {"role": "user", "content": f"What is the latest stable version of Go (Golang)? (Today is {CURRENT_DATE})"}
-    ]
+    client = _get_openai_client(base_url)
 
-    print(f"\nSending request to qwen-plus with web_search tool defined...")
-    print(f"  User: What is the latest stable version of Go (Golang)? (Today is {CURRENT_DATE})")
+    messages = [GO_VERSION_MESSAGE]
 
     max_iterations = 5
     iteration = 0
@@ -101,109 +221,95 @@ def test_openai_explicit_tool_call(label=""):
     try:
         while iteration < max_iterations:
             iteration += 1
-            print(f"\n--- Iteration {iteration} ---")
+            log.append(f"\n--- Iteration {iteration} ---")
 
             response = client.chat.completions.create(
                 model="qwen-plus",
                 messages=messages,
-                tools=tools,
-                max_tokens=500
+                tools=WEB_SEARCH_TOOLS,
+                max_tokens=500,
+                stream=True
             )
+            finish_reason, content, tool_calls = _read_stream(response)
 
             # Check response
-            if response.choices:
-                choice = response.choices[0]
-                print(f"Finish reason: {choice.finish_reason}")
+            if finish_reason:
+                log.append(f"Finish reason: {finish_reason}")
 
-                if choice.finish_reason == "tool_calls" and choice.message.tool_calls:
+                if finish_reason == "tool_calls" and tool_calls:
                     # Provider wants to call tools - add assistant message and check if intercepted
-                    print(f"  Provider wants to call {len(choice.message.tool_calls)} tool(s)")
+                    log.append(f"  Provider wants to call {len(tool_calls)} tool(s)")
 
-                    assistant_message = {
+                    # One assistant turn carrying every call, then one result per call
+                    messages.append({
                         "role": "assistant",
-                        "content": choice.message.content or "",
-                        "tool_calls": []
-                    }
-
-                    for tool_call in choice.message.tool_calls:
-                        tc_dict = {
-                            "id": tool_call.id,
-                            "type": "function",
-                            "function": {
-                                "name": tool_call.function.name,
-                                "arguments": tool_call.function.arguments
-                            }
-                        }
-                        assistant_message["tool_calls"].append(tc_dict)
+                        "content": content,
+                        "tool_calls": tool_calls
+                    })
 
+                    for tool_call in tool_calls:
                         # Check if this is web_search
-                        if tool_call.function.name == "web_search":
-                            args = json.loads(tool_call.function.arguments)
-                            print(f"  Tool: web_search(query='{args.get('query')}', count={args.get('count', 5)})")
-                            print(f"  ⚠️  Tool was NOT intercepted by server (client executed)")
-                            print(f"     Server tool interceptor should have handled this!")
+                        if tool_call["function"]["name"] == "web_search":
+                            args = json.loads(tool_call["function"]["arguments"])
+                            log.append(f"  Tool: web_search(query='{args.get('query')}', count={args.get('count', 5)})")
+                            log.append("  ⚠️  Tool was NOT intercepted by server (client executed)")
+                            log.append("     Server tool interceptor should have handled this!")
 
                             # Client-side fallback (since server didn't intercept)
-                            tool_result = json.dumps({
-                                "results": [{
-                                    "title": f"Search result for: {args.get('query')}",
-                                    "url": "https://example.com",
-                                    "snippet": "This is a client-side fallback result."
-                                }]
-                            })
+                            tool_result = _FALLBACK_RESULT_TMPL % json.dumps(str(args.get("query")))[1:-1]
 
-                            messages.append(assistant_message)
                             messages.append({
                                 "role": "tool",
-                                "tool_call_id": tool_call.id,
+                                "tool_call_id": tool_call["id"],
                                 "content": tool_result
                             })
                         else:
                             # Unknown tool - return error
-                            messages.append(assistant_message)
                             messages.append({
                                 "role": "tool",
-                                "tool_call_id": tool_call.id,
-                                "content": json.dumps({"error": f"Unknown tool: {tool_call.function.name}"})
+                                "tool_call_id": tool_call["id"],
+                                "content": json.dumps({"error": f"Unknown tool: {tool_call['function']['name']}"})
                             })
 
-                    print(f"  Continuing loop...")
+                    log.append("  Continuing loop...")
+                    _emit(log)
+                    log = []
                     continue
 
-                elif choice.finish_reason == "stop":
-                    if choice.message.content:
-                        print(f"\n✅ Final answer received!")
-                        print(f"\nAssistant: {choice.message.content}")
+                elif finish_reason == "stop":
+                    if content:
+                        log.append("\n✅ Final answer received!")
+                        log.append(f"\nAssistant: {content}")
                         return True
                     else:
-                        print(f"\n⚠️  Empty response (no content)")
+                        log.append("\n⚠️  Empty response (no content)")
                         return False
 
             return False
 
-        print(f"\n⚠️  Max iterations ({max_iterations}) reached")
+        log.append(f"\n⚠️  Max iterations ({max_iterations}) reached")
         return False
 
     except Exception as e:
-        print(f"\n❌ ERROR: {e}")
-        import traceback
-        traceback.print_exc()
+        log.append(f"\n❌ ERROR: {type(e).__name__}: {e}")
+        if DEBUG:
+            log.append(traceback.format_exc().rstrip())
         return False
+    finally:
+        _emit(log)
 
 
-def test_openai_baseline():
+def test_openai_baseline(base_url=BASE_URL):
     """Test OpenAI endpoint with a simple question (no tools)."""
-    print("\n" + "="*70)
-    print("Testing OpenAI endpoint with simple question (baseline)")
-    print("="*70)
-
-    client = OpenAI(
-        base_url=OPENAI_ENDPOINT,
-        api_key=API_KEY
-    )
+    log = [
+        "\n" + "="*70,
+        "Testing OpenAI endpoint with simple question (baseline)",
+        "="*70,
+        "\nUser: What is 2+2?",
+        "\nSending request to qwen-plus...",
+    ]
 
-    print(f"\nUser: What is 2+2?")
-    print(f"\nSending request to qwen-plus...")
+    client = _get_openai_client(base_url)
 
     try:
         response = client.chat.completions.create(
@@ -211,45 +317,37 @@ def test_openai_baseline():
             messages=[
                 {"role": "user", "content": "What is 2+2?"}
             ],
-            max_tokens=100
+            max_tokens=100,
+            stream=True
         )
 
-        result = response.choices[0].message.content
-        print(f"\nAssistant: {result}")
-        print(f"\n✅ SUCCESS: Basic endpoint working!")
+        _, result, _ = _read_stream(response)
+        log.append(f"\nAssistant: {result}")
+        log.append("\n✅ SUCCESS: Basic endpoint working!")
         return True
 
     except Exception as e:
-        print(f"\n❌ ERROR: {e}")
+        log.append(f"\n❌ ERROR: {e}")
         return False
+    finally:
+        _emit(log)
 
 
-def test_anthropic_explicit_tool_call(label=""):
+def test_anthropic_explicit_tool_call(label="", base_url=BASE_URL):
     """Test Anthropic-style endpoint - GLM has built-in web_search."""
-    print("\n" + "="*70)
-    print(f"Testing Anthropic-style endpoint (GLM has built-in web_search) {label}")
-    print("Expected: Provider uses native web_search (no tool definition sent)")
-    print("="*70)
-
-    import requests
-
-    messages = [
-        {
-            "role": "user",
-            "content": f"What is the latest stable version of Go (Golang)? (Today is {CURRENT_DATE})"
-        }
+    log = [
+        "\n" + "="*70,
+        f"Testing Anthropic-style endpoint (GLM has built-in web_search) {label}",
+        "Expected: Provider uses native web_search (no tool definition sent)",
+        "="*70,
+        "\nSending request to tingly/anthropic (no tool definition)...",
+        f"  User: {GO_VERSION_PROMPT}",
+        "  Note: GLM has built-in web_search, so we don't send tool definition",
     ]
 
-    print(f"\nSending request to tingly/anthropic (no tool definition)...")
-    print(f"  User: What is the latest stable version of Go (Golang)? (Today is {CURRENT_DATE})")
-    print(f"  Note: GLM has built-in web_search, so we don't send tool definition")
+    messages = [GO_VERSION_MESSAGE]
 
-    url = f"{ANTHROPIC_ENDPOINT}/messages"
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {API_KEY}",
-        "anthropic-version": "2023-06-01"
-    }
+    url = f"{base_url}/tingly/anthropic/v1/messages"
 
     try:
         data = {
@@ -258,7 +356,7 @@ def test_anthropic_explicit_tool_call(label=""):
             "messages": messages
         }
 
-        response = requests.post(url, json=data, headers=headers, timeout=30)
+        response = _SESSION.post(url, json=data, headers=_auth_headers(), timeout=30)
         response.raise_for_status()
         result_json = response.json()
 
@@ -271,109 +369,211 @@ def test_anthropic_explicit_tool_call(label=""):
                     if block_type == "text":
                         text = block.get("text", "")
                         if text:
-                            print(f"\n✅ Final answer received!")
-                            print(f"\nAssistant: {text}")
+                            log.append("\n✅ Final answer received!")
+                            log.append(f"\nAssistant: {text}")
                             return True
 
-        print(f"\n⚠️  Unexpected response format")
-        print(f"   Response: {json.dumps(result_json, indent=2)[:500]}")
+        log.append("\n⚠️  Unexpected response format")
+        log.append(f"   Response: {json.dumps(result_json, indent=2)[:500]}")
         return False
 
     except requests.exceptions.HTTPError as e:
         if "401" in str(e):
-            print(f"\n⚠️  GLM API token expired (401 Unauthorized)")
-            print(f"   This is expected for GLM built-in web_search")
+            log.append("\n⚠️  GLM API token expired (401 Unauthorized)")
+            log.append("   This is expected for GLM built-in web_search")
             return True
         else:
-            print(f"\n❌ ERROR: {e}")
+            log.append(f"\n❌ ERROR: {e}")
             return False
     except Exception as e:
-        print(f"\n❌ ERROR: {e}")
-        import traceback
-        traceback.print_exc()
+        log.append(f"\n❌ ERROR: {type(e).__name__}: {e}")
+        if DEBUG:
+            log.append(traceback.format_exc().rstrip())
         return False
+    finally:
+        _emit(log)
 
 
 def _read_config(path: str) -> dict:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return json.loads(f.read())
 
 
 def _write_config(path: str, cfg: dict) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(cfg, f, indent=2, ensure_ascii=False)
+    data = json.dumps(cfg, indent=2, ensure_ascii=False).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(data)
 
 
-def _restart_server(bin_path: str, config_dir: str) -> bool:
-    if not os.path.exists(bin_path):
-        print(f"⚠️  Server binary not found: {bin_path}")
-        return False
+# Upper bounds for the server CLI; `stop` waits up to 5s before force-killing
+STOP_TIMEOUT = 15
+START_TIMEOUT = 10
+
+
+def _stop_server(bin_path: str, config_dir: str) -> None:
+    # On timeout, subprocess.run kills the hung `stop` process itself
     try:
         subprocess.run(
             [bin_path, "stop", "--config-dir", config_dir],
             check=False,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
+            timeout=STOP_TIMEOUT,
         )
+    except subprocess.TimeoutExpired:
+        print(f"⚠️  Server stop did not finish within {STOP_TIMEOUT}s")
+
+
+def _restart_server(bin_path: str, config_dir: str, port: int = DEFAULT_PORT) -> bool:
+    if not os.path.exists(bin_path):
+        print(f"⚠️  Server binary not found: {bin_path}")
+        return False
+    try:
+        _stop_server(bin_path, config_dir)
         subprocess.run(
-            [bin_path, "start", "--config-dir", config_dir, "--port", "12580", "--daemon"],
+            [bin_path, "start", "--config-dir", config_dir, "--port", str(port), "--daemon"],
             check=True,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
+            timeout=START_TIMEOUT,
         )
-        time.sleep(2)
-        return True
     except Exception as exc:
         print(f"⚠️  Failed to restart server: {exc}")
         return False
+    if not _wait_for_server(f"http://127.0.0.1:{port}"):
+        print("⚠️  Server did not become ready after restart")
+        return False
+    return True
+
+
+def _wait_for_server(base_url: str = BASE_URL, timeout: float = 10.0) -> bool:
+    """Poll the OpenAI models endpoint until the server answers.
+
+    `stop` waits for the old server to exit, so any HTTP response here comes
+    from the restarted one. Sleeps start at 50ms and double up to 1.6s.
+    """
+    url = f"{base_url}/tingly/openai/v1/models"
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while True:
+        try:
+            _SESSION.get(url, timeout=0.5)
+            return True
+        except requests.RequestException:
+            pass
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 1.6)
+
 
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
 
-def run_with_prefer_local_search(enabled: bool, server_bin: str) -> bool:
-    if not CONFIG_PATH:
+
+def _require_test_config_dir() -> None:
+    if not _config_path():
         raise RuntimeError(
             "TINGLY_BOX_TEST_CONFIG_DIR is required for configuration mutation tests"
         )
     developer_config_dir = os.path.realpath(
         os.path.join(os.path.expanduser("~"), ".tingly-box")
     )
-    if os.path.realpath(CONFIG_DIR) == developer_config_dir:
+    if os.path.realpath(_config_dir()) == developer_config_dir:
         raise RuntimeError("Refusing to modify the developer configuration directory")
 
-    config_dir = os.path.dirname(CONFIG_PATH)
-    cfg = _read_config(CONFIG_PATH)
+
+def _set_prefer_local_search(cfg: dict, enabled: bool) -> None:
     tool_cfg = cfg.get("tool_interceptor")
     if tool_cfg is None:
         tool_cfg = {}
     tool_cfg["prefer_local_search"] = bool(enabled)
     cfg["tool_interceptor"] = tool_cfg
 
-    with tempfile.NamedTemporaryFile("w+", delete=False, encoding="utf-8") as tmp:
-        json.dump(cfg, tmp, indent=2, ensure_ascii=False)
-        tmp_path = tmp.name
+
+def _run_tool_call_tests(enabled: bool, base_url: str = BASE_URL) -> tuple:
+    label = "(prefer_local_search=on)" if enabled else "(prefer_local_search=off)"
+    # The two endpoints are independent, so test them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        openai_ok = executor.submit(test_openai_explicit_tool_call, label=label, base_url=base_url)
+        anthropic_ok = executor.submit(test_anthropic_explicit_tool_call, label=label, base_url=base_url)
+        return openai_ok.result(), anthropic_ok.result()
+
+
+def run_with_prefer_local_search(enabled: bool, server_bin: str) -> tuple:
+    _require_test_config_dir()
+
+    config_path = _config_path()
+    config_dir = os.path.dirname(config_path)
+    cfg = _read_config(config_path)
+    if (cfg.get("tool_interceptor") or {}).get("prefer_local_search") is bool(enabled):
+        # Already set: leave the file alone, so there is nothing to restore
+        # and no second restart afterwards
+        if not _restart_server(server_bin, config_dir):
+            return False, False
+        return _run_tool_call_tests(enabled)
+    _set_prefer_local_search(cfg, enabled)
+
+    # Stage the new config next to the original so the rename stays on one
+    # filesystem
+    tmp_path = config_path + ".tmp"
+    _write_config(tmp_path, cfg)
 
     # Backup original config
-    backup_path = CONFIG_PATH + ".bak"
-    os.replace(CONFIG_PATH, backup_path)
-    os.replace(tmp_path, CONFIG_PATH)
+    backup_path = config_path + ".bak"
+    os.replace(config_path, backup_path)
+    os.replace(tmp_path, config_path)
 
     try:
         if not _restart_server(server_bin, config_dir):
-            return False
-        label = "(prefer_local_search=on)" if enabled else "(prefer_local_search=off)"
-        ok1 = test_openai_explicit_tool_call(label=label)
-        ok2 = test_anthropic_explicit_tool_call(label=label)
-        return ok1, ok2
+            return False, False
+        return _run_tool_call_tests(enabled)
     finally:
         # Restore original config
         if os.path.exists(backup_path):
-            os.replace(backup_path, CONFIG_PATH)
+            os.replace(backup_path, config_path)
             _restart_server(server_bin, config_dir)
 
 
+def copy_test_config_dir(dest: str, enabled: bool, server_bin: str) -> str:
+    """Copy the test config directory to dest with prefer_local_search set.
+
+    The configured server is stopped first, so its SQLite database is not
+    copied halfway through a write; run_with_prefer_local_search restarts it.
+    """
+    _require_test_config_dir()
+    config_dir = _config_dir()
+    _stop_server(server_bin, config_dir)
+    shutil.copytree(config_dir, dest, ignore=shutil.ignore_patterns("*.bak", "*.tmp", "*.lock"))
+    config_path = os.path.join(dest, "config.json")
+    cfg = _read_config(config_path)
+    _set_prefer_local_search(cfg, enabled)
+    _write_config(config_path, cfg)
+    return dest
+
+
+def run_on_config_copy(enabled: bool, server_bin: str, config_dir: str, port: int) -> tuple:
+    """Run the tool-call tests on a second server started from a config copy.
+
+    The original directory and its server are left alone, so this can run
+    alongside run_with_prefer_local_search. The second server is stopped
+    afterwards.
+    """
+    try:
+        if not _restart_server(server_bin, config_dir, port):
+            return False, False
+        return _run_tool_call_tests(enabled, f"http://127.0.0.1:{port}")
+    finally:
+        _stop_server(server_bin, config_dir)
+
+
 def main():
     """Run all tests."""
-    global API_KEY
-    API_KEY = resolve_api_key()
+    # Fail early if no key is available; later calls hit the cache
+    resolve_api_key()
 
     print("\n" + "="*70)
     print("Web Search Functionality Test Suite (Explicit Tool Calls)")
@@ -384,10 +584,17 @@ def main():
 
     results = {}
 
-    # Comparison tests toggling prefer_local_search (qwen + glm)
-    server_bin = os.environ.get("TINGLY_BOX_BIN", DEFAULT_SERVER_BIN)
-    qwen_off, glm_off = run_with_prefer_local_search(False, server_bin)
-    qwen_on, glm_on = run_with_prefer_local_search(True, server_bin)
+    # Comparison tests toggling prefer_local_search (qwen + glm). "off" runs on
+    # the configured directory; "on" runs at the same time on a second server
+    # started from a copy of it.
+    server_bin = os.environ.get("TINGLY_BOX_BIN", _default_server_bin())
+    with tempfile.TemporaryDirectory(prefix="tingly-box-web-search-") as tmp:
+        copy_dir = copy_test_config_dir(os.path.join(tmp, "config"), True, server_bin)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            off = executor.submit(run_with_prefer_local_search, False, server_bin)
+            on = executor.submit(run_on_config_copy, True, server_bin, copy_dir, _free_port())
+            qwen_off, glm_off = off.result()
+            qwen_on, glm_on = on.result()
 
     results['qwen_prefer_local_off'] = qwen_off
     results['glm_prefer_local_off'] = glm_off